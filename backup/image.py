@@ -1,12 +1,61 @@
 """Image generator for social media posts."""
 
+import asyncio
+import functools
+import hashlib
+import io
 import logging
+import os
+import textwrap
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+
+# Import Pillow conditionally to handle environments without it
+try:
+    import PIL
+    from PIL import Image, ImageDraw, ImageFont
+    PILLOW_AVAILABLE = True
+except ImportError:
+    PILLOW_AVAILABLE = False
+    logging.warning("⚠️ Pillow not available. Image generation disabled.")
 
 from myrcat.models import TrackInfo
 from myrcat.exceptions import ImageGenerationError
 
+# Single-pass baseline JPEG encoding: 4:2:0 chroma subsampling, no extra
+# Huffman optimization pass and no progressive scans
+JPEG_SAVE_OPTIONS = {
+    "format": "JPEG",
+    "quality": 90,
+    "subsampling": 2,
+    "optimize": False,
+    "progressive": False,
+}
+
+# Maximum number of rendered images (encoded JPEG bytes) remembered for reuse
+RENDER_CACHE_SIZE = 32
+
+# Strongest darkening (alpha out of 255) applied at the bottom of the placeholder
+PLACEHOLDER_GRADIENT_MAX_ALPHA = 64
+
+# Characters rendered once per font at startup so their glyphs are cached before the first track
+FONT_WARMUP_TEXT = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,:!?'-&()/"
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_program(name: str) -> str:
+    """Normalize a program name to its template key (e.g. "Now Wave Mix" -> "now_wave_mix").
+    
+    Args:
+        name: Program name
+        
+    Returns:
+        Template key for the program
+    """
+    return name.lower().replace(" ", "_")
+
 
 class ImageGenerator:
     """Generates custom artwork for social media posts."""
@@ -30,8 +79,43 @@ class ImageGenerator:
         self.template_dir.mkdir(parents=True, exist_ok=True)
         self.font_dir.mkdir(parents=True, exist_ok=True)
         
+        # Widths of fixed strings (e.g. the station name), keyed by (font id, text)
+        self._text_metric_cache: Dict[Tuple[int, str], float] = {}
+
+        # Image rendering is CPU-bound, so run it off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+        # Previously rendered images (render key -> encoded JPEG), in LRU order.
+        # Holding the bytes rather than an output path keeps hits correct even
+        # when callers later overwrite that path with a different track.
+        self._render_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+        if not PILLOW_AVAILABLE:
+            self.templates = {"default": None}
+            return
+
         # Load templates
         self.templates = self._load_templates()
+
+        # Load fonts once - sizes are fixed, so they can be reused for every image
+        self._load_fonts()
+        self._warm_up_fonts()
+
+        # Placeholder background and gradient never change, so build them once
+        self._build_placeholder_assets()
+
+        self._check_pillow_simd()
+
+    @classmethod
+    def _check_pillow_simd(cls) -> None:
+        """Log which Pillow build is loaded and recommend Pillow-SIMD if not in use."""
+        # Pillow-SIMD releases are versioned as "<pillow version>.postN"
+        if ".post" in PIL.__version__:
+            logging.debug(f"🖼 Using Pillow-SIMD {PIL.__version__}")
+        else:
+            logging.warning(
+                f"⚠️ Using standard Pillow {PIL.__version__} - install pillow-simd for faster image rendering"
+            )
         
     def _load_templates(self) -> Dict[str, Path]:
         """Load available template backgrounds.
@@ -40,21 +124,161 @@ class ImageGenerator:
             Dictionary of template names to file paths
         """
         templates = {}
+        # Everything needed to render a template, fetched with a single lookup:
+        # (path, (size, raw RGBA bytes), layout). Decoded pixels make each render
+        # a single memcpy and the layout only depends on the template size.
+        self._template_by_key: Dict[str, Tuple[Path, Tuple[Tuple[int, int], bytes], Dict[str, float]]] = {}
         try:
+            # Scan the template directory once for PNG files
+            with os.scandir(self.template_dir) as entries:
+                png_entries = [
+                    entry for entry in entries
+                    if entry.name.endswith(".png") and entry.is_file()
+                ]
+
             # Add a default template if no templates exist
-            if not list(self.template_dir.glob("*.png")):
+            if not png_entries:
                 logging.warning("⚠️ No template images found in template directory")
                 return {"default": None}
                 
-            for template_file in self.template_dir.glob("*.png"):
+            for entry in png_entries:
+                template_file = Path(entry.path)
+                # Skip unreadable templates so one bad file doesn't lose the rest
+                try:
+                    img = Image.open(template_file).convert("RGBA")
+                    img.load()
+                except Exception as e:
+                    logging.error(f"💥 Error loading image template {template_file.name}: {e}")
+                    continue
                 templates[template_file.stem] = template_file
-                
+                self._template_by_key[template_file.stem] = (
+                    template_file,
+                    (img.size, img.tobytes()),
+                    self._compute_layout(*img.size),
+                )
+
+            if not templates:
+                logging.warning("⚠️ No usable template images in template directory")
+                return {"default": None}
+
             logging.debug(f"🖼 Loaded {len(templates)} image templates")
             return templates
         except Exception as e:
             logging.error(f"💥 Error loading image templates: {e}")
             return {"default": None}
         
+    @staticmethod
+    def _compute_layout(width: int, height: int) -> Dict[str, float]:
+        """Compute text positions for a template of the given size.
+        
+        Args:
+            width: Template width in pixels
+            height: Template height in pixels
+            
+        Returns:
+            Dictionary of layout values used when drawing on the template
+        """
+        margin = min(width, height) * 0.05  # 5% of the smaller dimension
+        return {
+            "width": width,
+            "height": height,
+            "center_x": width / 2,
+            "margin": margin,
+            "artist_y": height * 0.25,  # 25% from top
+            "title_y_center": height / 2,
+            "title_max_width": width * 0.7,  # Use 70% of image width
+            "album_y": height * 0.7,  # 70% from top
+            "station_x_offset": width - margin,
+            "station_y_offset": height - margin,
+        }
+
+    def _load_fonts(self) -> None:
+        """Load and cache the fonts used for template and placeholder images."""
+        bold_font_path = self.font_dir / "bold.ttf"
+        regular_font_path = self.font_dir / "regular.ttf"
+        light_font_path = self.font_dir / "light.ttf"
+
+        # Use default fonts unless all custom fonts are available
+        if not bold_font_path.exists() or not regular_font_path.exists() or not light_font_path.exists():
+            bold_font_path = regular_font_path = light_font_path = None
+
+        def load_font(font_path: Optional[Path], size: int):
+            try:
+                if font_path:
+                    return ImageFont.truetype(str(font_path), size)
+                return ImageFont.truetype(size=size)
+            except Exception:
+                # If default fonts fail, use built-in default
+                return ImageFont.load_default()
+
+        # Fonts for template-based images
+        self._title_font = load_font(bold_font_path, 36)
+        self._artist_font = load_font(regular_font_path, 30)
+        self._details_font = load_font(light_font_path, 24)
+
+        # Fonts for placeholder images (system fonts)
+        self._ph_title = load_font(None, 48)
+        self._ph_artist = load_font(None, 36)
+        self._ph_details = load_font(None, 24)
+
+        # Placeholder canvas uses the standard social media aspect ratio (1.91:1)
+        width, height = 1200, 630
+        self._placeholder_layout = {
+            "width": width,
+            "height": height,
+            "center_x": width / 2,
+            "margin": min(width, height) * 0.1,  # 10% margin
+            "artist_y": height * 0.25,
+            "title_y": height * 0.45,  # Start in the middle
+            "title_spacing": int(self._ph_title.size * 0.2),
+            "album_y": height * 0.75,
+            "station_y": height - self._ph_details.size * 2,  # Bottom with margin
+        }
+
+    def _warm_up_fonts(self) -> None:
+        """Render common characters with each cached font to prime FreeType's glyph cache.
+        
+        Glyphs are loaded and rasterized lazily on first use, which otherwise
+        lands on the first image generated after startup.
+        """
+        warm_img = Image.new('L', (10, 10))
+        draw = ImageDraw.Draw(warm_img)
+        for font in (
+            self._title_font, self._artist_font, self._details_font,
+            self._ph_title, self._ph_artist, self._ph_details,
+        ):
+            try:
+                draw.text((0, 0), FONT_WARMUP_TEXT, font=font)
+            except Exception as e:
+                logging.debug(f"Font warmup skipped: {e}")
+
+    def _build_placeholder_assets(self) -> None:
+        """Build the placeholder background canvas and gradient mask."""
+        width = self._placeholder_layout["width"]
+        height = self._placeholder_layout["height"]
+
+        # Dark purple background, copied at the start of each placeholder render
+        self._placeholder_base = Image.new('RGB', (width, height), color=(40, 0, 40))
+
+        # Gradient overlay (dark at bottom, lighter at top): a one-pixel-wide
+        # alpha ramp stretched across the full width
+        max_alpha = PLACEHOLDER_GRADIENT_MAX_ALPHA
+        self._placeholder_gradient = Image.frombytes(
+            "L", (1, height), bytes(y * max_alpha // height for y in range(height))
+        ).resize((width, height), Image.Resampling.NEAREST)
+
+    def _apply_gradient(self, img) -> None:
+        """Darken the placeholder canvas in place with the cached gradient.
+        
+        Pasting black through the alpha ramp blends each pixel as
+        rgb * (255 - alpha) / 255 in a single pass inside Pillow, the same
+        result as compositing a black RGBA overlay without mode conversions.
+        
+        Args:
+            img: RGB placeholder image to darken
+        """
+        img.paste((0, 0, 0), (0, 0) + img.size, mask=self._placeholder_gradient)
+
     async def generate_track_image(self, track: TrackInfo, output_path: Path) -> Optional[Path]:
         """Generate a custom image for a track when album art isn't available.
         
@@ -66,221 +290,278 @@ class ImageGenerator:
             Path to the generated image or None if generation failed
         """
         # Check that PIL is available
-        try:
-            from PIL import Image, ImageDraw, ImageFont
-            import textwrap
-        except ImportError:
+        if not PILLOW_AVAILABLE:
             logging.error("💥 PIL/Pillow not installed - required for image generation")
             raise ImageGenerationError("PIL/Pillow not installed")
+
+        loop = asyncio.get_running_loop()
+        template_key, template = self._select_template(track)
+
+        # Identical renders (retries, repeated idents) reuse the previous image
+        render_key = hashlib.blake2b(
+            f"{template_key if template else ''}|{track.artist}|{track.title}|{track.album}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        image_data = self._render_cache.get(render_key)
+        if image_data is not None:
+            self._render_cache.move_to_end(render_key)
+            logging.debug(f"🖼 Reusing cached track image for {track.artist} - {track.title}")
+        else:
+            image_data = await loop.run_in_executor(
+                self._executor, self._generate_track_image_sync, track, template_key, template
+            )
+            if image_data is None:
+                return None
+            self._render_cache[render_key] = image_data
+            if len(self._render_cache) > RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
+
+        # Write the encoded JPEG on the default executor so the render workers
+        # can start encoding the next image while this one is flushed to disk
+        try:
+            await loop.run_in_executor(None, output_path.write_bytes, image_data)
+        except Exception as e:
+            logging.error(f"💥 Error saving track image to {output_path}: {e}")
+            return None
+
+        return output_path
+
+    def _select_template(self, track: TrackInfo) -> Tuple[str, Optional[Tuple]]:
+        """Choose a template based on program/show if available.
+        
+        Args:
+            track: TrackInfo object containing track information
+            
+        Returns:
+            Tuple of (template key, template record or None if no template exists)
+        """
+        template_key = "default"
+        template = None
+        if track.program:
+            sanitized_program = _normalize_program(track.program)
+            template = self._template_by_key.get(sanitized_program)
+            if template:
+                template_key = sanitized_program
+        if template is None:
+            template = self._template_by_key.get(template_key)
+        return template_key, template
+
+    @staticmethod
+    def _encode_jpeg(img) -> bytes:
+        """Encode an RGB image as JPEG into memory.
+        
+        Args:
+            img: RGB image to encode
+            
+        Returns:
+            Encoded JPEG data
+        """
+        buffer = io.BytesIO()
+        img.save(buffer, **JPEG_SAVE_OPTIONS)
+        return buffer.getvalue()
+
+    def _generate_track_image_sync(
+        self, track: TrackInfo, template_key: str, template: Optional[Tuple]
+    ) -> Optional[bytes]:
+        """Render a track image from a template (runs in the executor).
         
+        Args:
+            track: TrackInfo object containing track information
+            template_key: Key of the selected template
+            template: Template record from _select_template, or None
+            
+        Returns:
+            Encoded JPEG data or None if generation failed
+        """
         try:
-            # Choose a template based on program/show if available
-            template_key = "default"
-            if track.program:
-                sanitized_program = track.program.lower().replace(" ", "_")
-                if sanitized_program in self.templates:
-                    template_key = sanitized_program
-                    
             # Ensure template exists
-            if template_key not in self.templates or not self.templates[template_key]:
+            if template is None:
                 logging.warning(f"⚠️ Template '{template_key}' not found, using placeholder image")
-                return self._create_placeholder_image(track, output_path)
+                return self._create_placeholder_image(track)
                 
-            # Create a copy of the template
-            template_path = self.templates[template_key]
-            img = Image.open(template_path)
+            # Create a fresh image from the pre-decoded template pixels
+            _, (size, data), layout = template
+            img = Image.frombytes('RGBA', size, data)
             draw = ImageDraw.Draw(img)
             
-            # Get font paths
-            bold_font_path = self.font_dir / "bold.ttf"
-            regular_font_path = self.font_dir / "regular.ttf"
-            light_font_path = self.font_dir / "light.ttf"
+            # Use the fonts cached at initialization
+            title_font = self._title_font
+            artist_font = self._artist_font
+            details_font = self._details_font
             
-            # Use default fonts if custom fonts are not available
-            if not bold_font_path.exists() or not regular_font_path.exists() or not light_font_path.exists():
-                # Use default fonts
-                try:
-                    title_font = ImageFont.truetype(size=36)
-                    artist_font = ImageFont.truetype(size=30)
-                    details_font = ImageFont.truetype(size=24)
-                except Exception:
-                    # If default fonts fail, use built-in default
-                    title_font = ImageFont.load_default()
-                    artist_font = ImageFont.load_default()
-                    details_font = ImageFont.load_default()
-            else:
-                # Use custom fonts
-                title_font = ImageFont.truetype(str(bold_font_path), 36)
-                artist_font = ImageFont.truetype(str(regular_font_path), 30)
-                details_font = ImageFont.truetype(str(light_font_path), 24)
-            
-            # Position text with better spacing
-            width, height = img.size
-            
-            # Calculate better vertical spacing
-            vertical_spacing = height / 10  # 10% of image height
+            # Position text using the layout precomputed for this template; anchors
+            # let Pillow do the centering instead of measuring each string first
+            center_x = layout["center_x"]
             
             # Add artist (centered, higher on the image)
             artist_text = track.artist
-            artist_width = draw.textlength(artist_text, font=artist_font)
-            artist_position = ((width - artist_width) / 2, height * 0.25)  # 25% from top
-            draw.text(artist_position, artist_text, font=artist_font, fill=(255, 255, 255))
+            draw.text((center_x, layout["artist_y"]), artist_text, font=artist_font, fill=(255, 255, 255), anchor='ma')
             
             # Add title (centered, middle) with more space for multi-line
             title_text = track.title
             
-            # Wrap title if too long - more aggressive wrapping to ensure it fits
-            max_width = width * 0.7  # Use 70% of image width
+            # Wrap title if too long, using measured pixel widths
+            max_width = layout["title_max_width"]
             if draw.textlength(title_text, font=title_font) > max_width:
-                # Calculate approximate characters per line based on average character width
-                avg_char_width = draw.textlength("m", font=title_font)
-                chars_per_line = int(max_width / avg_char_width)
-                title_text = textwrap.fill(title_text, width=chars_per_line)
+                title_text, _, _ = self._wrap_to_pixels(draw, title_text, title_font, max_width)
             
-            # Get multiline text dimensions
-            title_lines = title_text.split('\n')
-            line_heights = [draw.textlength(line, font=title_font) for line in title_lines]
-            title_height = len(title_lines) * title_font.size
-            
-            # Center title in middle of image
-            title_width = max(line_heights) if line_heights else 0
-            title_y = (height / 2) - (title_height / 2)  # Vertically center in middle third
-            title_position = ((width - title_width) / 2, title_y)
-            
-            # Draw the title with proper line spacing
-            draw.text(title_position, title_text, font=title_font, fill=(255, 255, 255))
+            # Draw the title centered in the middle of the image, each line centered within the block
+            draw.multiline_text(
+                (center_x, layout["title_y_center"]),
+                title_text,
+                font=title_font,
+                fill=(255, 255, 255),
+                anchor='mm',
+                align='center',
+            )
             
             # Add album if available (centered, in bottom third but not too low)
             if track.album and track.album != track.title:  # Only if album differs from title
                 album_text = f"From: {track.album}"
-                album_width = draw.textlength(album_text, font=details_font)
-                album_position = ((width - album_width) / 2, height * 0.7)  # 70% from top
-                draw.text(album_position, album_text, font=details_font, fill=(200, 200, 200))
+                draw.text((center_x, layout["album_y"]), album_text, font=details_font, fill=(200, 200, 200), anchor='ma')
                 
             # Add logo/watermark (bottom right with better margin)
             station_text = "Now Wave Radio"
-            station_width = draw.textlength(station_text, font=details_font)
             # Position with a proper margin that scales with image size
-            margin = min(width, height) * 0.05  # 5% of the smaller dimension
-            draw.text((width - station_width - margin, height - details_font.size - margin), 
-                      station_text, font=details_font, fill=(180, 180, 180))
+            draw.text((layout["station_x_offset"], layout["station_y_offset"]),
+                      station_text, font=details_font, fill=(180, 180, 180), anchor='rb')
             
             # Convert to RGB mode if the image has an alpha channel (RGBA)
             if img.mode == 'RGBA':
                 # Create a black background image
                 background = Image.new('RGB', img.size, (0, 0, 0))
                 # Paste the image with transparency on the background
-                background.paste(img, mask=img.split()[3])  # Use alpha channel as mask
+                background.paste(img, mask=img.getchannel('A'))  # Use alpha channel as mask
                 # Use the background with image for saving
                 img = background
                 
-            # Save the image as JPEG (requires RGB mode)
-            img.save(output_path, format='JPEG', quality=95)
-            return output_path
+            # Encode the image as JPEG (requires RGB mode)
+            return self._encode_jpeg(img)
             
         except Exception as e:
             logging.error(f"💥 Error generating track image: {e}")
             return None
     
-    def _create_placeholder_image(self, track: TrackInfo, output_path: Path) -> Optional[Path]:
+    def _measure(self, draw, text: str, font) -> float:
+        """Measure the width of a fixed string, caching the result per font.
+        
+        Args:
+            draw: ImageDraw object used for text measurement
+            text: Text to measure
+            font: Font the text will be drawn with
+            
+        Returns:
+            Text width in pixels
+        """
+        key = (id(font), text)
+        width = self._text_metric_cache.get(key)
+        if width is None:
+            width = self._text_metric_cache[key] = draw.textlength(text, font=font)
+        return width
+
+    def _wrap_to_pixels(self, draw, text: str, font, max_px: float) -> Tuple[str, float, int]:
+        """Greedily wrap text so that each line fits within a pixel width.
+        
+        Line widths are accumulated from the per-word measurements, so callers
+        never need to split and re-measure the wrapped result.
+        
+        Args:
+            draw: ImageDraw object used for text measurement
+            text: Text to wrap
+            font: Font the text will be drawn with
+            max_px: Maximum line width in pixels
+            
+        Returns:
+            Tuple of (text with newlines between wrapped lines, widest line in pixels, number of lines)
+        """
+        space_width = self._measure(draw, " ", font)
+        word_widths = {}
+        lines = []
+        current_words = []
+        current_width = 0.0
+        max_line_width = 0.0
+
+        for word in text.split():
+            word_width = word_widths.get(word)
+            if word_width is None:
+                word_width = word_widths[word] = draw.textlength(word, font=font)
+
+            # Width of the line if this word is appended to it
+            candidate_width = current_width + space_width + word_width if current_words else word_width
+            if current_words and candidate_width > max_px:
+                lines.append(" ".join(current_words))
+                max_line_width = max(max_line_width, current_width)
+                current_words = [word]
+                current_width = word_width
+            else:
+                current_words.append(word)
+                current_width = candidate_width
+
+        if current_words:
+            lines.append(" ".join(current_words))
+            max_line_width = max(max_line_width, current_width)
+
+        return "\n".join(lines), max_line_width, len(lines)
+
+    def _create_placeholder_image(self, track: TrackInfo) -> Optional[bytes]:
         """Create a simple placeholder image when no template is available.
         
         Args:
             track: TrackInfo object containing track information
-            output_path: Path to save the generated image
             
         Returns:
-            Path to the generated image or None if generation failed
+            Encoded JPEG data or None if generation failed
         """
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            import textwrap
-            
             # Create a blank image with the standard social media aspect ratio (1.91:1)
-            width, height = 1200, 630
-            img = Image.new('RGB', (width, height), color=(40, 0, 40))  # Dark purple background
+            layout = self._placeholder_layout
+            width, height = layout["width"], layout["height"]
+            img = self._placeholder_base.copy()  # Dark purple background
             draw = ImageDraw.Draw(img)
             
-            # Try to load system fonts for better appearance
-            try:
-                # Try to find a suitable system font
-                title_font = ImageFont.truetype(size=48)
-                artist_font = ImageFont.truetype(size=36)
-                details_font = ImageFont.truetype(size=24)
-            except Exception:
-                # Fall back to default font if system fonts aren't available
-                title_font = ImageFont.load_default()
-                artist_font = ImageFont.load_default()
-                details_font = ImageFont.load_default()
+            # Use the placeholder fonts cached at initialization
+            title_font = self._ph_title
+            artist_font = self._ph_artist
+            details_font = self._ph_details
             
-            # Calculate positions for better layout
-            center_x = width / 2
-            margin = min(width, height) * 0.1  # 10% margin
+            # Use the precomputed placeholder layout, with anchors for centering
+            center_x = layout["center_x"]
+            margin = layout["margin"]
             
             # Add artist name (top third)
             artist_text = track.artist
-            artist_y = height * 0.25
-            try:
-                # Center the text if we have advanced font metrics
-                artist_width = draw.textlength(artist_text, font=artist_font)
-                artist_x = center_x - (artist_width / 2)
-            except:
-                # Fall back to approximation if textlength not available
-                artist_x = margin
-            draw.text((artist_x, artist_y), artist_text, fill=(255, 255, 255), font=artist_font)
+            draw.text((center_x, layout["artist_y"]), artist_text, fill=(255, 255, 255), font=artist_font, anchor='ma')
             
             # Add title (middle, possibly wrapped)
             title_text = track.title
             # Wrap text if needed
-            title_lines = textwrap.wrap(title_text, width=30)
-            title_y = height * 0.45  # Start in the middle
+            title_block = "\n".join(textwrap.wrap(title_text, width=30))
             
-            # Draw each line of the wrapped title
-            for line in title_lines:
-                try:
-                    line_width = draw.textlength(line, font=title_font)
-                    line_x = center_x - (line_width / 2)
-                except:
-                    line_x = margin
-                draw.text((line_x, title_y), line, fill=(255, 255, 255), font=title_font)
-                title_y += title_font.size * 1.2  # Move down for next line with spacing
+            # Draw all lines of the wrapped title centered, in a single call
+            draw.multiline_text(
+                (center_x, layout["title_y"]),
+                title_block,
+                fill=(255, 255, 255),
+                font=title_font,
+                anchor='ma',
+                align='center',
+                spacing=layout["title_spacing"],
+            )
             
             # Add album if available
             if track.album and track.album != track.title:
                 album_text = f"From: {track.album}"
-                album_y = height * 0.75
-                try:
-                    album_width = draw.textlength(album_text, font=details_font)
-                    album_x = center_x - (album_width / 2)
-                except:
-                    album_x = margin
-                draw.text((album_x, album_y), album_text, fill=(200, 200, 200), font=details_font)
+                draw.text((center_x, layout["album_y"]), album_text, fill=(200, 200, 200), font=details_font, anchor='ma')
             
             # Add Now Wave Radio text with proper positioning
             station_text = "Now Wave Radio"
-            station_y = height - details_font.size * 2  # Bottom with margin
-            try:
-                station_width = draw.textlength(station_text, font=details_font)
-                station_x = width - station_width - margin
-            except:
-                station_x = width - margin * 3  # Approximate position
-            draw.text((station_x, station_y), station_text, fill=(200, 200, 200), font=details_font)
+            draw.text((width - margin, layout["station_y"]), station_text, fill=(200, 200, 200), font=details_font, anchor='ra')
             
             # Add a gradient overlay for visual interest (dark at bottom, lighter at top)
-            gradient = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-            gradient_draw = ImageDraw.Draw(gradient)
-            for y in range(height):
-                # Create a subtle gradient
-                alpha = int((y / height) * 64)  # 0-64 transparency
-                gradient_draw.line([(0, y), (width, y)], fill=(0, 0, 0, alpha))
-            
-            # Overlay the gradient
-            img = Image.alpha_composite(img.convert('RGBA'), gradient)
+            self._apply_gradient(img)
             
-            # Save the image (already in RGB mode)
-            img = img.convert('RGB')  # Convert back to RGB for JPEG
-            img.save(output_path, format='JPEG', quality=95)
-            return output_path
+            # Encode the image (already in RGB mode)
+            return self._encode_jpeg(img)
         except Exception as e:
             logging.error(f"💥 Error creating placeholder image: {e}")
             return None
\ No newline at end of file
@@ -55,6 +55,14 @@ class Config:
         for section in required_sections:
             if not self.config_parser.has_section(section):
                 raise ConfigurationError(f"Missing required section: {section}")
+
+        # Catch a bad listening port now rather than after the event loop starts
+        try:
+            port = self.config_parser.getint("server", "port")
+        except (configparser.Error, ValueError) as e:
+            raise ConfigurationError(f"Invalid server port: {e}")
+        if not 0 < port < 65536:
+            raise ConfigurationError(f"Invalid server port: {port}")
     
     def _setup_defaults(self) -> None:
         """Set up default values for optional configuration."""
@@ -3,9 +3,9 @@
 import asyncio
 import logging
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Set, Tuple
 
 from myrcat.config import Config
 from myrcat.models import TrackInfo
@@ -18,6 +18,35 @@ from myrcat.managers.history import HistoryManager
 from myrcat.managers.social_media import SocialMediaManager
 from myrcat.managers.show import ShowHandler
 
+# Fields every Myriad payload must carry, whatever its media type
+REQUIRED_TRACK_FIELDS = frozenset({"title", "starttime", "duration", "media_id", "type"})
+
+# Maximum accepted length of each free-text field
+MAX_FIELD_LENGTHS = (
+    ("artist", 256),
+    ("title", 256),
+    ("album", 256),
+    ("publisher", 256),
+    ("ISRC", 16),
+    ("program", 128),
+    ("presenter", 128),
+)
+
+
+def _as_int(value: Any) -> int:
+    """Return value as an int, skipping the conversion when it already is one.
+
+    Args:
+        value: Parsed JSON value (int from the parser, or a numeric string)
+
+    Returns:
+        Integer value
+
+    Raises:
+        ValueError: If a string value is not numeric
+    """
+    return value if type(value) is int else int(value)
+
 
 class Myrcat:
     """Main application class for Myriad integration.
@@ -40,7 +69,9 @@ class Myrcat:
         # Load configuration
         self.config = Config(config_path)
         self.config_parser = self.config.get_raw_config()
-        self.last_processed_track = None
+        self.last_track_key: Optional[Tuple[str, str]] = None
+        self._publish_tasks: Set[asyncio.Task] = set()
+        self._queued_publish: Optional[asyncio.Task] = None
 
         # Setup logging
         log_level = self.config.get("general", "log_level")
@@ -82,6 +113,7 @@ class Myrcat:
             "web", "history_max_tracks", fallback=30
         )
         self.artwork_cache_dir = Path(self.config.get("artwork", "cache_directory"))
+        self.publish_delay = self.config.getint("general", "publish_delay", fallback=0)
 
         # Get default artwork path
         default_artwork = self.config.get("artwork", "default_artwork", fallback=None)
@@ -91,7 +123,8 @@ class Myrcat:
         if self.default_artwork_path:
             if self.default_artwork_path.exists():
                 logging.debug(
-                    f"🎨 Default artwork configured: {self.default_artwork_path}"
+                    "🎨 Default artwork configured: %s",
+                    self.default_artwork_path,
                 )
             else:
                 logging.warning(
@@ -111,7 +144,12 @@ class Myrcat:
         # Initialize or update components based on whether they already exist
         if not hasattr(self, "db"):
             # First-time initialization of core components
-            self.db = DatabaseManager(self.config.get("general", "database_path"))
+            self.db = DatabaseManager(
+                self.config.get("general", "database_path"),
+                flush_interval=self.config.getint(
+                    "general", "db_flush_interval", fallback=30
+                ),
+            )
             self.playlist = PlaylistManager(
                 self.playlist_json, self.playlist_txt, self.artwork_publish
             )
@@ -149,12 +187,12 @@ class Myrcat:
             # Update social media manager and its components
             if hasattr(self, "social"):
                 self.social.update_from_config()
-                logging.debug(f"🔄 Updated social media manager with new configuration")
+                logging.debug("🔄 Updated social media manager with new configuration")
 
             # Update show handler
             if hasattr(self, "show_handler"):
                 self.show_handler.load_config()
-                logging.debug(f"🔄 Updated show handler with new configuration")
+                logging.debug("🔄 Updated show handler with new configuration")
 
     def _apply_config_changes(self):
         """Apply configuration changes to all components.
@@ -201,7 +239,7 @@ class Myrcat:
         Returns:
             True if track should be skipped, False otherwise
         """
-        return any([title in self.skip_titles, artist in self.skip_artists])
+        return title in self.skip_titles or artist in self.skip_artists
 
     async def process_new_track(self, track_json: Dict[str, Any]):
         """Process new track data from Myriad.
@@ -210,7 +248,7 @@ class Myrcat:
             track_json: Track data from Myriad
         """
         try:
-            duration = int(track_json.get("duration", 0))
+            duration = _as_int(track_json.get("duration", 0))
 
             # Normalize type to lowercase and determine if it's a song
             media_type = track_json["type"].lower()
@@ -237,7 +275,7 @@ class Myrcat:
                 if self.default_artwork_path and self.default_artwork_path.exists():
                     new_artwork = await self.artwork.use_default_artwork()
                     if new_artwork:
-                        logging.debug(f"🎨 Using default artwork due to {reason}")
+                        logging.debug("🎨 Using default artwork due to %s", reason)
                         track_json["image"] = new_artwork
                         using_default_artwork = True
 
@@ -253,7 +291,7 @@ class Myrcat:
             title = clean_title(raw_title) if raw_title else "[No Title]"
 
             album = track_json.get("album", "")
-            year = int(track_json.get("year", 0)) if track_json.get("year") else None
+            year = _as_int(raw_year) if (raw_year := track_json.get("year")) else None
 
             # Create TrackInfo object
             track = TrackInfo(
@@ -274,7 +312,7 @@ class Myrcat:
             )
 
             # Delay publishing to the website to accommodate stream delay
-            delay_seconds = self.config.getint("general", "publish_delay", fallback=0)
+            delay_seconds = self.publish_delay
 
             # Flag to track if we're using default artwork (set later in the code)
             using_default_artwork = False
@@ -293,7 +331,9 @@ class Myrcat:
                     delay_seconds = max(5, delay_seconds // 2)
                     using_default_artwork = True
                     logging.debug(
-                        f"⏱️ Reducing publish delay from {original_delay}s to {delay_seconds}s for default artwork"
+                        "⏱️ Reducing publish delay from %ss to %ss for default artwork",
+                        original_delay,
+                        delay_seconds,
                     )
 
             if delay_seconds > 0:
@@ -303,39 +343,86 @@ class Myrcat:
                 future_timestamp = future_time.strftime("%H:%M:%S")
 
                 logging.info(
-                    f'"{track.title}" [{track.year}] - {track.artist}; queued for {future_timestamp}'
+                    '"%s" [%s] - %s; queued for %s',
+                    track.title,
+                    track.year,
+                    track.artist,
+                    future_timestamp,
                 )
             else:
-                logging.info(f'"{track.title}" [{track.year}] - {track.artist}')
+                logging.info('"%s" [%s] - %s', track.title, track.year, track.artist)
 
             # Check for duplicate track, in case we're messing with Myriad OCP
-            if (
-                self.last_processed_track
-                and track.artist == self.last_processed_track.artist
-                and track.title == self.last_processed_track.title
-            ):
-                logging.info(f"⛔️ Skipping - duplicate track!")
+            track_key = (track.artist, track.title)
+            if track_key == self.last_track_key:
+                logging.info("⛔️ Skipping - duplicate track!")
                 return
 
             if delay_seconds > 0:
                 # Make sure we don't delay longer than track duration
                 if duration and duration < delay_seconds:
                     logging.warning(
-                        f"⚠️ Adjusting track duration - ({duration}s) is shorter than publish_delay ({delay_seconds}s)"
+                        "⚠️ Adjusting track duration - (%ss) is shorter than publish_delay (%ss)",
+                        duration,
+                        delay_seconds,
                     )
                     delay_seconds = max(
                         2, duration - 5
                     )  # Leave at least 5s before next track
                 logging.debug(
-                    f"⏱️ Delaying track processing for {delay_seconds} seconds"
-                    + (
-                        " (reduced for default artwork)"
-                        if using_default_artwork
-                        else ""
-                    )
+                    "⏱️ Delaying track processing for %s seconds%s",
+                    delay_seconds,
+                    " (reduced for default artwork)" if using_default_artwork else "",
                 )
+
+            # A newer track supersedes one still waiting out its delay, so a
+            # shorter delay can never publish tracks out of order
+            if self._queued_publish is not None and not self._queued_publish.done():
+                logging.debug("⏭️ Dropping queued publish superseded by new track")
+                self._queued_publish.cancel()
+
+            # Mark the track as seen now, so a repeat arriving during the
+            # publish delay is caught as a duplicate
+            self.last_track_key = track_key
+
+            # Publish in the background so the Myriad connection closes now,
+            # rather than being held open for the whole publish delay
+            task = asyncio.create_task(
+                self._publish_track(track, is_complete, reason, delay_seconds)
+            )
+            self._publish_tasks.add(task)
+            task.add_done_callback(self._publish_tasks.discard)
+            self._queued_publish = task
+        except Exception as e:
+            logging.error("💥 Error in track update processing: %s", e)
+
+    async def _publish_track(
+        self,
+        track: TrackInfo,
+        is_complete: bool,
+        reason: Optional[str],
+        delay_seconds: int,
+    ):
+        """Wait out the publish delay, then publish the track everywhere.
+
+        Args:
+            track: Track prepared by process_new_track
+            is_complete: Whether the track has everything needed for full processing
+            reason: Why the track is incomplete, for logging
+            delay_seconds: Seconds to wait before publishing
+        """
+        try:
+            if delay_seconds > 0:
                 await asyncio.sleep(delay_seconds)
 
+            # Past the delay, so a newer track must no longer cancel this one
+            if self._queued_publish is asyncio.current_task():
+                self._queued_publish = None
+
+            # Single "played at" time, taken once publishing starts and shared by
+            # the history, social media and database updates
+            track.timestamp = datetime.now(timezone.utc)
+
             # Process artwork and determine further action based on track completeness
             new_filename = None
             artwork_hash = None
@@ -359,34 +446,47 @@ class Myrcat:
                             artwork_hash = await self.artwork.create_hashed_artwork(
                                 new_filename, track.artist, track.title
                             )
-                            logging.debug(f"🔑 Generated artwork hash: {artwork_hash}")
+                            logging.debug("🔑 Generated artwork hash: %s", artwork_hash)
                 # Generate hash even without image
                 elif track.artist and track.title:
                     artwork_hash = self.artwork.generate_hash(track.artist, track.title)
                     logging.debug(
-                        f"🔑 Generated artwork hash (no image): {artwork_hash}"
+                        "🔑 Generated artwork hash (no image): %s",
+                        artwork_hash,
                     )
 
-                # Full processing for complete tracks
-                await self.playlist.update_track(track, artwork_hash)
-                await self.history.add_track(track, artwork_hash)
+                # Show announcements go out before the track's own posts
                 await self.show_handler.check_show_transition(track)
 
+                # Playlist, history, social media and database are independent
+                # sinks, so publish to all of them concurrently
+                updates = {
+                    "playlist": self.playlist.update_track(track, artwork_hash),
+                    "history": self.history.add_track(track, artwork_hash),
+                    "database": self.db.log_db_playout(track),
+                }
+
                 # Social media posting (unless skipped)
                 if self.should_skip_track(track.title, track.artist):
-                    logging.info(f"⛔️ Skipping socials - filtered in config!")
+                    logging.info("⛔️ Skipping socials - filtered in config!")
                 else:
-                    await self.social.update_social_media(track)
+                    updates["social media"] = self.social.update_social_media(track)
 
-                # Database logging
-                await self.db.log_db_playout(track)
+                results = await asyncio.gather(
+                    *updates.values(), return_exceptions=True
+                )
+                for sink, result in zip(updates, results):
+                    if isinstance(result, Exception):
+                        logging.error("💥 Error updating %s: %s", sink, result)
 
                 logging.debug(
-                    f"📋 Updated track history with {track.artist} - {track.title}"
+                    "📋 Updated track history with %s - %s",
+                    track.artist,
+                    track.title,
                 )
             else:
                 # Limited processing for incomplete tracks
-                logging.info(f"⚙️ Processing incomplete track ({reason})")
+                logging.info("⚙️ Processing incomplete track (%s)", reason)
 
                 # Process any provided image if it's not already processed
                 if track.image and not (
@@ -397,7 +497,7 @@ class Myrcat:
                     new_filename = await self.artwork.process_artwork(track.image)
                     if new_filename:
                         track.image = new_filename
-                        logging.debug(f"🎨 Processed provided image: {new_filename}")
+                        logging.debug("🎨 Processed provided image: %s", new_filename)
 
                 # Only update playlist files (no hash)
                 await self.playlist.update_track(track, None)
@@ -406,15 +506,13 @@ class Myrcat:
                 await self.show_handler.check_show_transition(track)
 
                 # Log skipped operations
-                logging.debug(f"📋 Skipping history update for incomplete track")
-                logging.info(f"⛔️ Skipping socials for incomplete track")
-                logging.debug(f"💾 Skipping database logging for incomplete track")
+                logging.debug("📋 Skipping history update for incomplete track")
+                logging.info("⛔️ Skipping socials for incomplete track")
+                logging.debug("💾 Skipping database logging for incomplete track")
 
-            self.last_processed_track = track
-
-            logging.debug(f"✅ Published new playout!")
+            logging.debug("✅ Published new playout!")
         except Exception as e:
-            logging.error(f"💥 Error in track update processing: {e}")
+            logging.error("💥 Error in track update processing: %s", e)
 
     def validate_track_json(self, track_json: Dict[str, Any]) -> Tuple[bool, str]:
         """Validate incoming track data JSON.
@@ -429,8 +527,8 @@ class Myrcat:
             return False, "No JSON track data received!"
 
         # First check if required keys exist (but don't validate content yet)
-        basic_required_keys = {"title", "starttime", "duration", "media_id", "type"}
-        if missing := basic_required_keys - track_json.keys():
+        if not track_json.keys() >= REQUIRED_TRACK_FIELDS:
+            missing = REQUIRED_TRACK_FIELDS - track_json.keys()
             return False, f"Missing required fields: {', '.join(missing)}"
 
         # Check if this is a song type
@@ -442,35 +540,26 @@ class Myrcat:
 
         # However, we'll still warn about missing fields in debug logs
         if is_song and not track_json.get("artist"):
-            logging.debug(f"⚠️ Note: Song missing artist - will use special handling")
+            logging.debug("⚠️ Note: Song missing artist - will use special handling")
 
         if not track_json.get("title"):
-            logging.debug(f"⚠️ Note: Track missing title - will use special handling")
+            logging.debug("⚠️ Note: Track missing title - will use special handling")
 
         # Numeric validations
         try:
-            if (duration := int(track_json.get("duration", 0))) < 0:
+            if (duration := _as_int(track_json.get("duration", 0))) < 0:
                 return False, f"⚠️ Invalid duration: {duration}"
-            if (media_id := int(track_json.get("media_id", 0))) < 0:
+            if (media_id := _as_int(track_json.get("media_id", 0))) < 0:
                 return False, f"⚠️ Invalid media_id: {media_id}"
         except ValueError as e:
             return False, f"💥 Non-numeric value error: {e}"
 
-        # Check string lengths are reasonable
-        max_lens = {
-            "artist": 256,
-            "title": 256,
-            "album": 256,
-            "publisher": 256,
-            "ISRC": 16,
-            "program": 128,
-            "presenter": 128,
-        }
-
+        # Check string lengths are reasonable; values are almost always str already
         if oversized := [
             f
-            for f, max_len in max_lens.items()
-            if track_json.get(f) and len(str(track_json[f])) > max_len
+            for f, max_len in MAX_FIELD_LENGTHS
+            if (value := track_json.get(f))
+            and len(value if type(value) is str else str(value)) > max_len
         ]:
             return False, f"Fields exceed max length: {', '.join(oversized)}"
 
@@ -491,7 +580,7 @@ class Myrcat:
 
                 # Check engagement
                 try:
-                    logging.debug(f"📊 Running scheduled engagement check")
+                    logging.debug("📊 Running scheduled engagement check")
                     await self.social.check_post_engagement()
                 except Exception as e:
                     logging.error(f"💥 Error in scheduled engagement check: {e}")
@@ -518,7 +607,7 @@ class Myrcat:
                         # Apply configuration changes
                         self._apply_config_changes()
                         logging.debug(
-                            f"🔄 Applied configuration changes to all components"
+                            "🔄 Applied configuration changes to all components"
                         )
                 except Exception as e:
                     logging.error(f"💥 Error checking for config changes: {e}")
@@ -544,6 +633,9 @@ class Myrcat:
             config_check_task = asyncio.create_task(self.check_config_task())
             logging.info(f"⚙️ Configuration monitoring task started")
 
+            # Start periodic flush of queued database writes
+            db_flush_task = asyncio.create_task(self.db.flush_task())
+
             # Start the server
             await self.server.start()
         except KeyboardInterrupt:
@@ -567,4 +659,22 @@ class Myrcat:
                 except asyncio.CancelledError:
                     pass
 
+            # Drop tracks still waiting out their publish delay
+            for task in list(self._publish_tasks):
+                task.cancel()
+            if self._publish_tasks:
+                await asyncio.gather(*self._publish_tasks, return_exceptions=True)
+
+            # Cancel database flush task and write any queued playouts
+            if "db_flush_task" in locals():
+                db_flush_task.cancel()
+                try:
+                    await db_flush_task
+                except asyncio.CancelledError:
+                    pass
+            self.db.close()
+
+            # Write any pending history changes
+            await self.history.flush()
+
             await self.server.stop()
@@ -14,6 +14,13 @@ from myrcat import __version__
 from myrcat.core import Myrcat
 from myrcat.exceptions import MyrcatException, ConfigurationError
 
+# Use uvloop's libuv-based event loop when it is installed
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 def parse_arguments():
     """Parse command-line arguments.
@@ -47,6 +54,9 @@ def main():
         print(f"Error: Config file not found: {args.config}")
         sys.exit(1)
 
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         app = Myrcat(args.config)
         asyncio.run(app.run())
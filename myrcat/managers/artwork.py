@@ -1,12 +1,15 @@
 """Artwork manager for Myrcat."""
 
+import functools
 import logging
+import os
 import shutil
+import time
 import uuid
 import asyncio
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
 # Import Pillow conditionally to handle environments without it
 try:
@@ -18,6 +21,76 @@ except ImportError:
 
 from myrcat.exceptions import ArtworkError
 
+# Seconds between full sweeps of the publish directory for stray artwork
+ARTWORK_SWEEP_INTERVAL = 86400
+
+# How long to wait for incoming artwork, and the first/longest poll intervals
+ARTWORK_WAIT_TIMEOUT = 5.0
+ARTWORK_POLL_INITIAL = 0.02
+ARTWORK_POLL_MAX = 0.5
+
+
+def _js_string_hash(text: str) -> str:
+    """Hash a string the same way as the web player's JavaScript hash.
+    
+    Equivalent to ``hash = ((hash << 5) - hash) + charCodeAt(i)`` truncated to
+    32 bits. Characters are hashed by code point (not UTF-8 bytes) so results
+    match JavaScript for all BMP characters.
+    
+    Args:
+        text: String to hash
+        
+    Returns:
+        Hash as a lowercase hex string
+    """
+    hash_val = 0
+    for code in map(ord, text):
+        hash_val = (hash_val * 31 + code) & 0xFFFFFFFF
+    return format(hash_val, "x")
+
+
+@functools.lru_cache(maxsize=4096)
+def _artwork_hash(artist: str, title: str) -> str:
+    """Hash an artist/title pair for artwork filenames, memoised per pair.
+    
+    Keying the cache on the pair itself means repeat tracks skip building and
+    lower-casing the combined string as well as the hash loop.
+    
+    Args:
+        artist: Track artist
+        title: Track title
+        
+    Returns:
+        Hash as a lowercase hex string
+    """
+    return _js_string_hash(f"{artist}-{title}".lower())
+
+
+def _copy_file_contents(source: str, target: str) -> None:
+    """Copy file contents in the kernel where possible.
+    
+    Uses os.copy_file_range (Linux) so the data never passes through user
+    space, falling back to shutil.copyfile where it is unavailable.
+    
+    Args:
+        source: Path to the source file
+        target: Path to the target file
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as fsrc, open(target, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                return
+        except OSError:
+            pass  # e.g. cross-filesystem on older kernels; use the portable copy
+    shutil.copyfile(source, target)
+
 
 class ArtworkManager:
     """Manages artwork file operations."""
@@ -43,6 +116,15 @@ class ArtworkManager:
         self.default_artwork_path = default_artwork_path
         self.current_image: Optional[str] = None
 
+        # Only the previously published file is removed per track; a full
+        # directory sweep runs on first publish and then once per interval
+        self._previous_image: Optional[str] = None
+        self._last_sweep: Optional[float] = None
+
+        # Hashes whose cached artwork file is known to exist, so repeat plays
+        # of a track skip the filesystem checks entirely
+        self._cached_hashes: Set[str] = set()
+
         # Create directories if they don't exist
         self.publish_dir.mkdir(parents=True, exist_ok=True)
         if self.cached_artwork_dir:
@@ -67,27 +149,40 @@ class ArtworkManager:
             new_filename = f"{uuid.uuid4()}.jpg"
             publish_path = self.publish_dir / new_filename
             
-            # Copy file to publish directory with unique name
-            copy_success = await self._copy_file(
-                source_path=source_path,
-                target_path=publish_path
-            )
-            
-            if not copy_success:
-                return None
-                
-            # Remove source file if requested
+            # A source that is removed afterwards can simply be renamed into
+            # place (one metadata operation); this fails across filesystems
+            moved = False
             if remove_source:
                 try:
-                    source_path.unlink()
-                except Exception as e:
-                    logging.warning(f"⚠️ Could not remove source file {source_path}: {e}")
+                    os.replace(source_path, publish_path)
+                    moved = True
+                except OSError:
+                    pass
+
+            if not moved:
+                # Copy file to publish directory with unique name
+                copy_success = await self._copy_file(
+                    source_path=source_path,
+                    target_path=publish_path
+                )
+
+                if not copy_success:
+                    return None
+
+                # Remove source file if requested
+                if remove_source:
+                    try:
+                        await asyncio.get_running_loop().run_in_executor(None, source_path.unlink)
+                    except Exception as e:
+                        logging.warning(f"⚠️ Could not remove source file {source_path}: {e}")
                 
             # Update current image
             self.current_image = new_filename
             
             # Clean up old files from publish directory
-            await self.cleanup_old_artwork()
+            self._remove_previous_artwork(new_filename)
+            if self._last_sweep is None or time.monotonic() - self._last_sweep > ARTWORK_SWEEP_INTERVAL:
+                await self.cleanup_old_artwork()
             
             return new_filename
         except Exception as e:
@@ -117,7 +212,7 @@ class ArtworkManager:
         new_filename = await self._publish_image_to_artwork_dir(incoming_path, remove_source=True)
         
         if new_filename:
-            logging.debug(f"🎨 Artwork published: {new_filename}")
+            logging.debug("🎨 Artwork published: %s", new_filename)
             
         return new_filename
             
@@ -135,7 +230,7 @@ class ArtworkManager:
         new_filename = await self._publish_image_to_artwork_dir(self.default_artwork_path, remove_source=False)
         
         if new_filename:
-            logging.debug(f"🎨 Default artwork published: {new_filename}")
+            logging.debug("🎨 Default artwork published: %s", new_filename)
             
         return new_filename
 
@@ -158,6 +253,10 @@ class ArtworkManager:
         # Generate hash from artist and title
         artwork_hash = self.generate_hash(artist, title)
 
+        # Already cached during this run (tracks repeat in rotation)
+        if artwork_hash in self._cached_hashes:
+            return artwork_hash
+
         # Path to original artwork
         original_artwork = self.publish_dir / filename
 
@@ -172,12 +271,14 @@ class ArtworkManager:
             cached_artwork_path = self.cached_artwork_dir / cached_filename
 
             # Only copy if the cached file doesn't already exist
-            if not cached_artwork_path.exists():
-                await self._copy_file(
-                    source_path=original_artwork,
-                    target_path=cached_artwork_path,
-                    log_message=f"🎨 Created cached artwork: {cached_filename}"
-                )
+            if cached_artwork_path.exists():
+                self._cached_hashes.add(artwork_hash)
+            elif await self._copy_file(
+                source_path=original_artwork,
+                target_path=cached_artwork_path,
+                log_message=f"🎨 Created cached artwork: {cached_filename}"
+            ):
+                self._cached_hashes.add(artwork_hash)
 
             return artwork_hash
         except Exception as e:
@@ -204,8 +305,14 @@ class ArtworkManager:
             # Ensure the target directory exists
             target_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Copy the file
-            shutil.copy2(str(source_path), str(target_path))
+            # Hard link when on the same filesystem (no data copied); otherwise
+            # copy in a worker thread so the event loop is not blocked
+            try:
+                os.link(source_path, target_path)
+            except OSError:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, _copy_file_contents, str(source_path), str(target_path)
+                )
             
             # Log success message if provided
             if log_message:
@@ -217,7 +324,7 @@ class ArtworkManager:
             return False
 
     async def wait_for_file(self, incoming_path: Path) -> bool:
-        """Wait for file to appear, return True if found.
+        """Wait up to ARTWORK_WAIT_TIMEOUT seconds for file to appear, return True if found.
         
         Args:
             incoming_path: Path to the file to wait for
@@ -225,11 +332,19 @@ class ArtworkManager:
         Returns:
             True if the file exists, False otherwise
         """
-        for _ in range(10):
+        # Artwork usually lands just before or just after the track data, so
+        # poll quickly at first and back off towards the maximum interval
+        deadline = time.monotonic() + ARTWORK_WAIT_TIMEOUT
+        interval = ARTWORK_POLL_INITIAL
+        while True:
             if incoming_path.exists():
                 return True
-            await asyncio.sleep(0.5)
-        logging.debug(f"⚠️ wait_for_file failed on {incoming_path}")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, ARTWORK_POLL_MAX)
+        logging.debug("⚠️ wait_for_file failed on %s", incoming_path)
         return False
 
     def generate_hash(self, artist, title):
@@ -244,28 +359,41 @@ class ArtworkManager:
         Returns:
             Hash string
         """
-        str_to_hash = f"{artist}-{title}".lower()
-        hash_val = 0
-        for i in range(len(str_to_hash)):
-            hash_val = ((hash_val << 5) - hash_val) + ord(str_to_hash[i])
-            hash_val = (
-                hash_val & 0xFFFFFFFF
-            )  # Convert to 32bit integer (equivalent to |= 0 in JS)
+        # Cached, since the same tracks recur throughout a session
+        return _artwork_hash(artist, title)
 
-        return format(abs(hash_val), "x")  # Convert to hex string like in JS
+    def _remove_previous_artwork(self, new_filename: str) -> None:
+        """Remove the previously published artwork file.
+        
+        Args:
+            new_filename: Filename of the artwork that was just published
+        """
+        previous = self._previous_image
+        self._previous_image = new_filename
+        if not previous or previous == new_filename:
+            return
+        try:
+            (self.publish_dir / previous).unlink(missing_ok=True)
+            logging.debug("🧹 Removed old artwork: %s", previous)
+        except Exception as e:
+            logging.error(f"Error removing old artwork {previous}: {e}")
 
     async def cleanup_old_artwork(self) -> None:
-        """Remove old artwork files from publish directory."""
+        """Remove all old artwork files from publish directory."""
+        self._last_sweep = time.monotonic()
         try:
-            for file in self.publish_dir.glob("*.jpg"):
-                # Don't delete the current image file
-                if self.current_image and file.name == self.current_image:
-                    continue
-                try:
-                    file.unlink()
-                    logging.debug(f"🧹 Removed old artwork: {file.name}")
-                except Exception as e:
-                    logging.error(f"Error removing old artwork {file.name}: {e}")
+            with os.scandir(self.publish_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".jpg"):
+                        continue
+                    # Don't delete the current image file
+                    if self.current_image and entry.name == self.current_image:
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                        logging.debug("🧹 Removed old artwork: %s", entry.name)
+                    except Exception as e:
+                        logging.error(f"Error removing old artwork {entry.name}: {e}")
         except Exception as e:
             logging.error(f"💥 Error during artwork cleanup: {e}")
             
@@ -326,7 +454,7 @@ class ArtworkManager:
                 # Save the result
                 new_img.save(temp_path, format='JPEG', quality=90)
             
-            logging.debug(f"🖼️ Resized image for social media: {image_path.name} → {size[0]}x{size[1]}")
+            logging.debug("🖼️ Resized image for social media: %s → %sx%s", image_path.name, size[0], size[1])
             return temp_path, size
         except Exception as e:
             logging.error(f"💥 Error resizing image for social media: {e}")
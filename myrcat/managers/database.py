@@ -1,13 +1,32 @@
 """Database manager for Myrcat."""
 
+import asyncio
+import atexit
 import logging
 import sqlite3
-from datetime import datetime
-from typing import Optional
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Optional, Tuple
 
 from myrcat.models import TrackInfo
 from myrcat.exceptions import DatabaseError
 
+# Seconds between ANALYZE runs that refresh query planner statistics for playouts
+ANALYZE_INTERVAL = 86400
+
+
+# Playout insert used for batched writes; timestamp is captured when the track is queued.
+# Always pass this same string so SQLite's statement cache is hit on every flush.
+PLAYOUT_INSERT_SQL = """
+    INSERT INTO playouts (
+        artist, title, album, publisher, year, isrc,
+        starttime, duration, media_id, program,
+        presenter, timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class DatabaseManager:
     """Manages SQLite database operations for track logging.
@@ -20,24 +39,48 @@ class DatabaseManager:
     - Add database connection pooling for performance
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, flush_interval: int = 30, batch_size: int = 50):
         """Initialize the database manager.
         
         Args:
             db_path: Path to the SQLite database file
+            flush_interval: Seconds between flushes of queued playouts
+            batch_size: Number of queued playouts that triggers an immediate flush
         """
         self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
 
         # Register adapter for datetime objects
         sqlite3.register_adapter(datetime, lambda dt: dt.isoformat())
 
         self.setup_database()
 
+        # Long-lived writer connection; transactions are managed explicitly when flushing
+        self.conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False, cached_statements=128
+        )
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA cache_size = -20000")  # 20 MB page cache
+        self.conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB memory map
+
+        # Reused for every batch so the compiled insert statement stays cached
+        self._cursor = self.conn.cursor()
+
+        # Playout rows waiting to be written in the next batch
+        self._pending: Deque[Tuple] = deque()
+        self._flush_lock = threading.Lock()
+
+        # Make sure queued playouts reach the database on interpreter exit
+        atexit.register(self.close)
+
     def setup_database(self):
         """Verify database schema is compatible with current version."""
         try:
             # Expected schema version - update this when schema.sql changes
-            EXPECTED_VERSION = 1
+            EXPECTED_VERSION = 2
             
             with self._get_connection() as conn:
                 # Check if version table exists
@@ -62,7 +105,13 @@ class DatabaseManager:
                     logging.error("💥 Please update your database schema with the latest schema.sql file")
                     raise DatabaseError(f"Database schema version mismatch. Expected v{EXPECTED_VERSION}, found v{db_version}")
                 
-                logging.debug(f"✅ Database schema version {db_version} verified")
+                logging.debug("✅ Database schema version %s verified", db_version)
+
+                # WAL lets readers run alongside the writer and needs one fsync per
+                # commit instead of two; the mode is stored in the database file
+                journal_mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+                if journal_mode.lower() != "wal":
+                    logging.warning(f"⚠️ Could not enable WAL mode, using {journal_mode} journal")
                 
         except sqlite3.Error as e:
             logging.error(f"💥 Database setup error: {e}")
@@ -81,6 +130,9 @@ class DatabaseManager:
             # Enable foreign keys
             conn = sqlite3.connect(self.db_path)
             conn.execute("PRAGMA foreign_keys = ON")
+
+            # Safe with WAL: commits stay durable across application crashes
+            conn.execute("PRAGMA synchronous = NORMAL")
             
             # Enable row factory for dict-like access
             conn.row_factory = sqlite3.Row
@@ -125,7 +177,10 @@ class DatabaseManager:
             return None
 
     async def log_db_playout(self, track: TrackInfo):
-        """Log track play to database for SoundExchange reporting.
+        """Queue track play for the database for SoundExchange reporting.
+        
+        Rows are buffered and written in batches by flush_task, or immediately
+        once batch_size rows are waiting.
         
         Args:
             track: TrackInfo object to log
@@ -133,35 +188,102 @@ class DatabaseManager:
         Raises:
             DatabaseError: If database operation fails
         """
+        self._pending.append(
+            (
+                track.artist,
+                track.title,
+                track.album,
+                track.publisher,
+                track.year,
+                track.isrc,
+                track.starttime,
+                track.duration,
+                track.media_id,
+                track.program,
+                track.presenter,
+                # Same format as SQLite's datetime('now')
+                track.timestamp.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+            )
+        )
+        logging.debug("📈 Queued for database (%s pending)", len(self._pending))
+
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self):
+        """Write all queued playouts to the database in a single transaction.
+        
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if self._pending:
+            await asyncio.get_running_loop().run_in_executor(None, self._flush_pending)
+
+    def _flush_pending(self):
+        """Insert queued playouts with executemany inside one transaction.
+        
+        Rows are put back in the queue if the write fails, so they are retried
+        on the next flush.
+        
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        with self._flush_lock:
+            rows = [self._pending.popleft() for _ in range(len(self._pending))]
+            if not rows:
+                return
+
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self._cursor.executemany(PLAYOUT_INSERT_SQL, rows)
+                self.conn.execute("COMMIT")
+                logging.debug("📈 Logged %s playout(s) to database", len(rows))
+            except Exception as e:
+                if self.conn.in_transaction:
+                    self.conn.execute("ROLLBACK")
+                self._pending.extendleft(reversed(rows))
+                logging.error(f"💥 Database error: {e}")
+                # Add more detailed error logging
+                if isinstance(e, sqlite3.OperationalError):
+                    logging.error(f"💥 SQLite DB error details: {str(e)}")
+                raise DatabaseError(f"Failed to log tracks to database: {e}")
+
+    def _analyze(self):
+        """Refresh query planner statistics for the playouts indexes."""
+        with self._flush_lock:
+            try:
+                self.conn.execute("ANALYZE playouts")
+                logging.debug("📈 Updated playouts index statistics")
+            except sqlite3.Error as e:
+                logging.warning(f"⚠️ Could not analyze playouts table: {e}")
+
+    async def flush_task(self):
+        """Periodic task to flush queued playouts and refresh index statistics."""
+        loop = asyncio.get_running_loop()
+        last_analyze = time.monotonic()
         try:
-            query = """
-                INSERT INTO playouts (
-                    artist, title, album, publisher, year, isrc,
-                    starttime, duration, media_id, program,
-                    presenter, timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
-            """
-            with self._get_connection() as conn:
-                conn.execute(
-                    query,
-                    (
-                        track.artist,
-                        track.title,
-                        track.album,
-                        track.publisher,
-                        track.year,
-                        track.isrc,
-                        track.starttime,
-                        track.duration,
-                        track.media_id,
-                        track.program,
-                        track.presenter,
-                    ),
-                )
-                logging.debug(f"📈 Logged to database")
-        except Exception as e:
-            logging.error(f"💥 Database error: {e}")
-            # Add more detailed error logging
-            if isinstance(e, sqlite3.OperationalError):
-                logging.error(f"💥 SQLite DB error details: {str(e)}")
-            raise DatabaseError(f"Failed to log track to database: {e}")
\ No newline at end of file
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                try:
+                    await self.flush()
+                except DatabaseError:
+                    # Already logged; rows stay queued for the next attempt
+                    pass
+
+                if time.monotonic() - last_analyze > ANALYZE_INTERVAL:
+                    last_analyze = time.monotonic()
+                    await loop.run_in_executor(None, self._analyze)
+        except asyncio.CancelledError:
+            logging.debug("📈 Database flush task cancelled")
+
+    def close(self):
+        """Flush any queued playouts and close the writer connection."""
+        if self.conn is None:
+            return
+        try:
+            self._flush_pending()
+        except DatabaseError:
+            logging.error(f"💥 {len(self._pending)} playout(s) could not be written on shutdown")
+        finally:
+            self.conn.close()
+            self.conn = None
\ No newline at end of file
@@ -1,14 +1,18 @@
 """History manager for Myrcat."""
 
+import asyncio
 import json
 import logging
 from collections import deque
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from myrcat.models import TrackInfo
 from myrcat.exceptions import MyrcatException
+from myrcat.utils import write_json_file
+
+# Seconds to wait before writing history.json, so quick track changes share one write
+HISTORY_SAVE_DELAY = 0.5
 
 
 class HistoryManager:
@@ -24,6 +28,12 @@ class HistoryManager:
         self.history_json_path = history_json_path
         self.max_tracks = max_tracks
         self.track_history = deque(maxlen=max_tracks)
+
+        # Pending debounced write of history.json, if any. _dirty marks changes
+        # not yet handed to a write; _writing is set while a write is in flight
+        self._save_task: Optional[asyncio.Task] = None
+        self._dirty = False
+        self._writing = False
         
         # Ensure parent directory exists
         self.history_json_path.parent.mkdir(parents=True, exist_ok=True)
@@ -41,7 +51,7 @@ class HistoryManager:
                 if isinstance(history_data, list):
                     # Only keep up to max_tracks
                     self.track_history = deque(history_data[:self.max_tracks], maxlen=self.max_tracks)
-                    logging.debug(f"📋 Loaded {len(self.track_history)} tracks from history.json")
+                    logging.debug("📋 Loaded %s tracks from history.json", len(self.track_history))
                 else:
                     logging.warning("⚠️ history.json exists but is not a list, creating new history")
         except Exception as e:
@@ -61,7 +71,7 @@ class HistoryManager:
                 "artist": track.artist,
                 "album": track.album,
                 "artwork_url": f"/player/publish/{track.image}" if track.image else None,
-                "played_at": datetime.now(timezone.utc).isoformat(),
+                "played_at": track.timestamp.isoformat(),
             }
             
             # Add image_hash if provided - this will be used by the embeds
@@ -82,20 +92,72 @@ class HistoryManager:
                 self.track_history.appendleft(track_entry)
                 logging.debug("📋 Added new track to history")
             
-            # Write updated history to file
-            await self.save_history()
+            # Schedule a write of the updated history
+            self._dirty = True
+            self._schedule_save()
             
         except Exception as e:
             logging.error(f"💥 Error adding track to history: {e}")
     
+    def _schedule_save(self) -> None:
+        """Schedule a debounced write of history.json.
+        
+        Tracks added while a write is pending are included in that write, and
+        tracks added while a write is in flight trigger another write after it.
+        """
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._delayed_save())
+
+    async def _delayed_save(self) -> None:
+        """Wait for the debounce delay, then write history.json until it is current."""
+        try:
+            await asyncio.sleep(HISTORY_SAVE_DELAY)
+        except asyncio.CancelledError:
+            # flush() cut the debounce delay short; write right away
+            pass
+
+        self._writing = True
+        try:
+            while self._dirty:
+                self._dirty = False
+                await self.save_history()
+        finally:
+            self._writing = False
+
+    async def flush(self) -> None:
+        """Write any pending history changes immediately.
+        
+        A write already in flight is waited for rather than cancelled, so two
+        threads never write history.json at the same time.
+        """
+        task = self._save_task
+        if task is not None and not task.done():
+            if not self._writing:
+                # Still in the debounce delay: skip the rest of it
+                task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                # Cancelled before it started, so nothing was written
+                pass
+
+        if self._dirty:
+            self._dirty = False
+            await self.save_history()
+
     async def save_history(self) -> None:
-        """Write track history to history.json file."""
+        """Write track history to history.json file.
+        
+        The file is written to a temporary path and renamed into place, so
+        readers never see a partially written file.
+        """
         try:
-            with open(self.history_json_path, 'w') as f:
-                # Convert deque to list for JSON serialization
-                json.dump(list(self.track_history), f, indent=2)
+            # Snapshot the entries, since serialization happens in a worker thread
+            await write_json_file(
+                self.history_json_path, [dict(entry) for entry in self.track_history]
+            )
             
-            logging.debug(f"📋 Saved {len(self.track_history)} tracks to history.json")
+            logging.debug("📋 Saved %s tracks to history.json", len(self.track_history))
         except Exception as e:
             logging.error(f"💥 Error saving history.json: {e}")
     
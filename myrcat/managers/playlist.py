@@ -1,12 +1,13 @@
 """Playlist manager for Myrcat."""
 
-import json
+import asyncio
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from myrcat.models import TrackInfo
 from myrcat.exceptions import MyrcatException
+from myrcat.utils import write_json_file, write_file_atomic
 
 
 class PlaylistManager:
@@ -27,6 +28,10 @@ class PlaylistManager:
         self.artwork_publish_path = artwork_publish_path
         self.current_track: Optional[TrackInfo] = None
 
+        # Last content written to each playlist file, to skip rewriting identical content
+        self._last_json: Optional[Dict[str, Any]] = None
+        self._last_txt: Optional[str] = None
+
         # Ensure parent directories exists
         self.playlist_json.parent.mkdir(parents=True, exist_ok=True)
         self.playlist_txt.parent.mkdir(parents=True, exist_ok=True)
@@ -85,9 +90,13 @@ class PlaylistManager:
                     "image_hash": "",  # Clear image_hash
                 }
 
+            if playlist_data == self._last_json:
+                logging.debug("💾 JSON playlist unchanged, skipping write")
+                return
+
             # Write JSON file with proper indentation for readability
-            with open(self.playlist_json, "w") as f:
-                json.dump(playlist_data, f, indent=4)
+            await write_json_file(self.playlist_json, playlist_data, indent=4)
+            self._last_json = playlist_data
 
             logging.debug("💾 Saved new JSON playlist file")
         except Exception as e:
@@ -102,12 +111,19 @@ class PlaylistManager:
         try:
             if track.is_song:
                 # Standard format for songs
-                with open(self.playlist_txt, "w") as txt_file:
-                    txt_file.write(f"{track.artist} - {track.title}\n")
+                text = f"{track.artist} - {track.title}\n"
             else:
                 # Fixed text for non-song media types
-                with open(self.playlist_txt, "w") as txt_file:
-                    txt_file.write("The Next Wave Today - Now Wave Radio\n")
+                text = "The Next Wave Today - Now Wave Radio\n"
+
+            if text == self._last_txt:
+                logging.debug("💾 TXT playlist unchanged, skipping write")
+                return
+
+            await asyncio.get_running_loop().run_in_executor(
+                None, write_file_atomic, self.playlist_txt, text.encode("utf-8")
+            )
+            self._last_txt = text
 
             logging.debug("💾 Saved new TXT playlist file")
         except Exception as e:
@@ -1,5 +1,7 @@
 """Social media manager for Myrcat."""
 
+import asyncio
+import functools
 import logging
 import configparser
 import time
@@ -9,8 +11,10 @@ from typing import Dict, Any, Optional, List, Tuple
 
 import pylast
 import pylistenbrainz
+import requests
 from atproto import Client as AtprotoClient
 from facebook import GraphAPI
+from requests.adapters import HTTPAdapter
 
 from myrcat.models import TrackInfo
 from myrcat.exceptions import SocialMediaError
@@ -20,6 +24,23 @@ from myrcat.managers.artwork import ArtworkManager
 from myrcat.managers.database import DatabaseManager
 
 
+# Log in to Bluesky again after this many seconds, even if the session still works
+BLUESKY_SESSION_TTL = 6 * 3600
+
+# XRPC error names meaning the Bluesky session is no longer accepted
+BLUESKY_AUTH_ERRORS = frozenset(
+    {"ExpiredToken", "InvalidToken", "AuthMissing", "AuthenticationRequired"}
+)
+
+# Platform names and the client attribute each one's update_<client> method relies on
+PLATFORM_CLIENTS = (
+    ("LastFM", "lastfm"),
+    ("ListenBrainz", "listenbrainz"),
+    ("Bluesky", "bluesky"),
+    ("Facebook", "facebook"),
+)
+
+
 class SocialMediaManager:
     """Handles social media platform updates."""
 
@@ -78,6 +99,15 @@ class SocialMediaManager:
         # Initialize analytics
         self.analytics = SocialMediaAnalytics(config, db_manager)
 
+        # Standard post text for the most recent track, shared by all platforms
+        self._post_text_cache: Optional[Tuple[Tuple, Tuple[str, str]]] = None
+
+        # Shared HTTP session so Facebook Graph API calls reuse keep-alive connections
+        self._fb_session = requests.Session()
+        self._fb_session.mount(
+            "https://", HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        )
+
         # Initialize services that are enabled
         if self.publish_enabled:
             if self.service_enabled["LastFM"]:
@@ -89,6 +119,9 @@ class SocialMediaManager:
             if self.service_enabled["Facebook"]:
                 self.setup_facebook()
 
+        # Update methods for enabled platforms, rebuilt only when config changes
+        self._active_updaters = self._build_active_updaters()
+
     def setup_lastfm(self):
         """Initialize Last.FM API connection using pylast."""
         try:
@@ -117,7 +150,10 @@ class SocialMediaManager:
 
     def setup_bluesky(self):
         """Initialize Bluesky client."""
+        # One client is kept for the lifetime of the manager; login happens on first use
         self.bluesky = AtprotoClient()
+        self._bluesky_last_login = 0.0
+        self._bluesky_lock = None
         self.bluesky_handle = self.config["bluesky"]["handle"]
         self.bluesky_password = self.config["bluesky"]["app_password"]
         self.bluesky_enable_images = self.config.getboolean(
@@ -179,7 +215,9 @@ class SocialMediaManager:
                         
                         # Initialize the Facebook client with the token
                         if self._fb_access_token:
-                            self.facebook = GraphAPI(self._fb_access_token)
+                            self.facebook = GraphAPI(
+                                self._fb_access_token, session=self._fb_session
+                            )
                             
                             # Calculate days until expiration and log detailed information
                             if self._fb_token_expires_at:
@@ -295,6 +333,146 @@ class SocialMediaManager:
             and self.bluesky_password
         )
         
+    def _build_active_updaters(self) -> Tuple[Tuple[str, Any], ...]:
+        """Build the update methods for platforms that are enabled and initialized.
+
+        Platforms whose client failed to initialize are left out here, once,
+        instead of being skipped inside their update method on every track.
+
+        Returns:
+            Tuple of (platform name, update coroutine function) tuples
+        """
+        if not self.publish_enabled:
+            return ()
+
+        active = []
+        for platform, client_attr in PLATFORM_CLIENTS:
+            if not self.service_enabled.get(platform, False):
+                continue
+            if getattr(self, client_attr, None) is None:
+                logging.warning(f"⚠️ {platform} is enabled but not initialized - updates skipped")
+                continue
+            active.append((platform, getattr(self, f"update_{client_attr}")))
+        return tuple(active)
+
+    def _build_post_text(self, track: TrackInfo) -> Tuple[str, str]:
+        """Build the standard (non-AI) post text for a track.
+
+        The result is cached for the current track so each platform reuses it.
+
+        Args:
+            track: TrackInfo object containing track information
+
+        Returns:
+            Tuple of (short message, message including the album line)
+        """
+        key = (track.artist, track.title, track.album)
+        if self._post_text_cache and self._post_text_cache[0] == key:
+            return self._post_text_cache[1]
+
+        short_msg = f"🎵 Now Playing on Now Wave Radio:\n{track.artist} - {track.title}"
+        long_msg = f"{short_msg}\nFrom the album: {track.album}" if track.album else short_msg
+        self._post_text_cache = (key, (short_msg, long_msg))
+        return short_msg, long_msg
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking SDK or HTTP call in the default executor.
+
+        The platform client libraries are synchronous, so calling them
+        directly would stall the event loop (and the socket server) for the
+        full request round trip.
+
+        Args:
+            func: Blocking callable to run
+            *args: Positional arguments to pass to the callable
+            **kwargs: Keyword arguments to pass to the callable
+
+        Returns:
+            Return value of the callable
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def _get_bluesky_client(self) -> AtprotoClient:
+        """Get the shared Bluesky client, logging in only when needed.
+
+        The session is reused across posts and engagement checks. A new login
+        happens on first use, after BLUESKY_SESSION_TTL, or after an
+        authentication error has invalidated the session.
+
+        Returns:
+            Logged-in AtprotoClient instance
+        """
+        # Created here rather than in setup_bluesky so it binds to the running loop
+        if self._bluesky_lock is None:
+            self._bluesky_lock = asyncio.Lock()
+
+        async with self._bluesky_lock:
+            session_age = time.monotonic() - self._bluesky_last_login
+            if not self._bluesky_last_login or session_age > BLUESKY_SESSION_TTL:
+                await self._run_blocking(
+                    self.bluesky.login, self.bluesky_handle, self.bluesky_password
+                )
+                self._bluesky_last_login = time.monotonic()
+                logging.debug(f"🔵 Logged in to Bluesky as {self.bluesky_handle}")
+
+        return self.bluesky
+
+    @staticmethod
+    def _is_bluesky_auth_error(error: Exception) -> bool:
+        """Check whether an atproto error means the session was rejected.
+
+        atproto request errors carry the HTTP response; auth failures are a 401
+        or an XRPC error such as ExpiredToken (which Bluesky returns as a 400).
+
+        Args:
+            error: Exception raised by a Bluesky API call
+
+        Returns:
+            True if logging in again may fix the error, False otherwise
+        """
+        response = getattr(error, "response", None)
+        if response is None:
+            return False
+        if getattr(response, "status_code", None) == 401:
+            return True
+        return getattr(getattr(response, "content", None), "error", None) in BLUESKY_AUTH_ERRORS
+
+    def _invalidate_bluesky_session(self, error: Exception):
+        """Force a fresh Bluesky login on next use if the error is an auth failure.
+
+        Args:
+            error: Exception raised by a Bluesky API call
+        """
+        if self._is_bluesky_auth_error(error):
+            logging.debug(f"🔵 Bluesky session invalidated: {error}")
+            self._bluesky_last_login = 0.0
+
+    async def _run_bluesky(self, func, *args, **kwargs):
+        """Run a blocking Bluesky API call, retrying once after a fresh login.
+
+        If the session has been rejected (for example an expired token), the
+        client logs in again and the same call is repeated once, so the post
+        that hit the expired session is not lost.
+
+        Args:
+            func: Bound method of the shared Bluesky client
+            *args: Positional arguments to pass to the method
+            **kwargs: Keyword arguments to pass to the method
+
+        Returns:
+            Return value of the API call
+        """
+        try:
+            return await self._run_blocking(func, *args, **kwargs)
+        except Exception as e:
+            if not self._is_bluesky_auth_error(e):
+                raise
+            logging.warning(f"⚠️ Bluesky session rejected, logging in again: {e}")
+            self._bluesky_last_login = 0.0
+            await self._get_bluesky_client()
+            return await self._run_blocking(func, *args, **kwargs)
+
     def facebook_credentials_valid(self) -> bool:
         """Check if Facebook credentials are valid and complete.
         
@@ -484,10 +662,13 @@ class SocialMediaManager:
         if not hasattr(self, "lastfm"):
             return  # Service not initialized - excluded in config
 
-        lastfm_timestamp = int(datetime.now(timezone.utc).timestamp())
+        lastfm_timestamp = int(track.timestamp.timestamp())
         try:
-            self.lastfm.scrobble(
-                artist=track.artist, title=track.title, timestamp=lastfm_timestamp
+            await self._run_blocking(
+                self.lastfm.scrobble,
+                artist=track.artist,
+                title=track.title,
+                timestamp=lastfm_timestamp,
             )
             logging.debug(f"📒 Updated Last.FM")
         except Exception as e:
@@ -506,9 +687,11 @@ class SocialMediaManager:
             lb_listen = pylistenbrainz.Listen(
                 track_name=track.title,
                 artist_name=track.artist,
-                listened_at=int(time.time()),
+                listened_at=int(track.timestamp.timestamp()),
+            )
+            lb_response = await self._run_blocking(
+                self.listenbrainz.submit_single_listen, lb_listen
             )
-            lb_response = self.listenbrainz.submit_single_listen(lb_listen)
             logging.debug(f"📒 Updated ListenBrainz")
         except Exception as error:
             logging.error(f"💥 Listenbrainz update error: {error}")
@@ -546,9 +729,7 @@ class SocialMediaManager:
             return False
 
         try:
-            # Login for each update as the session might expire
-            client = AtprotoClient()
-            client.login(self.bluesky_handle, self.bluesky_password)
+            client = await self._get_bluesky_client()
 
             # Generate post text based on track info
             content_source = "standard"
@@ -565,11 +746,7 @@ class SocialMediaManager:
                     source_details = content_metadata.get("template_name", "unknown")
             else:
                 # Use standard text if AI is disabled
-                post_text = (
-                    f"🎵 Now Playing on Now Wave Radio:\n{track.artist} - {track.title}"
-                )
-                if track.album:
-                    post_text += f"\nFrom the album: {track.album}"
+                post_text = self._build_post_text(track)[1]
 
             # Create embed with image if available
             embed = None
@@ -602,7 +779,9 @@ class SocialMediaManager:
                         # Upload the image to Bluesky
                         with open(upload_path, "rb") as f:
                             image_data = f.read()
-                        blob = client.com.atproto.repo.upload_blob(image_data)
+                        blob = await self._run_bluesky(
+                            client.com.atproto.repo.upload_blob, image_data
+                        )
 
                         # Clean up temp file if it exists
                         if temp_resized and temp_resized.exists():
@@ -729,11 +908,11 @@ class SocialMediaManager:
                         )
                     else:
                         # Content itself is too long, fallback to a simpler message
-                        post_text = f"🎵 Now Playing on Now Wave Radio:\n{track.artist} - {track.title}"
+                        post_text = self._build_post_text(track)[0]
                         logging.debug(f"⚠️ Using fallback simple message: {post_text}")
                 else:
                     # No hashtags to trim, use fallback
-                    post_text = f"🎵 Now Playing on Now Wave Radio:\n{track.artist} - {track.title}"
+                    post_text = self._build_post_text(track)[0]
                     logging.debug(f"⚠️ Using fallback simple message: {post_text}")
 
             # Log the complete post text for debugging
@@ -769,12 +948,13 @@ class SocialMediaManager:
                 post_record["facets"] = facets
 
             # Send the post
-            response = client.com.atproto.repo.create_record(
+            response = await self._run_bluesky(
+                client.com.atproto.repo.create_record,
                 {
                     "repo": client.me.did,
                     "collection": "app.bsky.feed.post",
                     "record": post_record,
-                }
+                },
             )
 
             # Track post in analytics
@@ -806,6 +986,7 @@ class SocialMediaManager:
 
         except Exception as e:
             logging.error(f"💥 Bluesky update error: {e}")
+            self._invalidate_bluesky_session(e)
             return False
 
     async def update_facebook(self, track: TrackInfo):
@@ -861,9 +1042,7 @@ class SocialMediaManager:
                     source_details = content_metadata.get("template_name", "unknown")
             else:
                 # Use standard text if AI is disabled
-                post_text = f"🎵 Now Playing on Now Wave Radio:\n{track.artist} - {track.title}"
-                if track.album:
-                    post_text += f"\nFrom the album: {track.album}"
+                post_text = self._build_post_text(track)[1]
                 if track.program:
                     post_text += f"\nProgram: {track.program}"
                 if track.presenter:
@@ -959,11 +1138,11 @@ class SocialMediaManager:
                         )
                     else:
                         # Content itself is too long, fallback to a simpler message
-                        post_text = f"🎵 Now Playing on Now Wave Radio:\n{track.artist} - {track.title}"
+                        post_text = self._build_post_text(track)[0]
                         logging.debug(f"⚠️ Using fallback simple message: {post_text}")
                 else:
                     # No hashtags to trim, use fallback
-                    post_text = f"🎵 Now Playing on Now Wave Radio:\n{track.artist} - {track.title}"
+                    post_text = self._build_post_text(track)[0]
                     logging.debug(f"⚠️ Using fallback simple message: {post_text}")
 
             # Log the complete post text for debugging
@@ -1078,22 +1257,21 @@ class SocialMediaManager:
             logging.debug("⚠️ Social media publishing is disabled globally!")
             return
 
-        updates = {
-            "LastFM": self.update_lastfm,
-            "ListenBrainz": self.update_listenbrainz,
-            "Bluesky": self.update_bluesky,
-            "Facebook": self.update_facebook,
-        }
+        # Build the standard post text once; platforms pick it up from the cache
+        self._build_post_text(track)
 
-        for platform, update_func in updates.items():
-            if self.service_enabled.get(platform, False):
-                try:
-                    logging.debug(f"Updating {platform}...")
-                    await update_func(track)
-                except Exception as e:
-                    logging.error(f"💥 Error updating {platform}: {e}")
-            else:
-                logging.debug(f"Skipping {platform} (disabled in config)")
+        async def run_update(platform: str, update_func):
+            try:
+                logging.debug(f"Updating {platform}...")
+                await update_func(track)
+            except Exception as e:
+                logging.error(f"💥 Error updating {platform}: {e}")
+
+        # Platforms are independent, so update them concurrently
+        await asyncio.gather(
+            *(run_update(platform, update_func) for platform, update_func in self._active_updaters),
+            return_exceptions=True,
+        )
 
     def update_from_config(self):
         """Update manager settings from current configuration.
@@ -1118,6 +1296,8 @@ class SocialMediaManager:
             "Facebook": self.config.getboolean("facebook", "enabled", fallback=False)
         }
         
+        self._active_updaters = self._build_active_updaters()
+
         # Log changes
         enabled_services = [name for name, enabled in self.service_enabled.items() if enabled]
         if enabled_services:
@@ -1213,8 +1393,6 @@ class SocialMediaManager:
                 return False
                 
             # Use the OAuth framework to exchange tokens
-            import requests
-            
             url = f"https://graph.facebook.com/v18.0/oauth/access_token"
             params = {
                 "grant_type": "fb_exchange_token",
@@ -1223,14 +1401,14 @@ class SocialMediaManager:
                 "fb_exchange_token": current_token
             }
             
-            response = requests.get(url, params=params)
+            response = await self._run_blocking(self._fb_session.get, url, params=params)
             result = response.json()
             
             if "access_token" in result:
                 new_token = result["access_token"]
                 
                 # Update the token in memory
-                self.facebook = GraphAPI(new_token)
+                self.facebook = GraphAPI(new_token, session=self._fb_session)
                 
                 # Store the token in database only
                 await self._store_facebook_token(new_token, result.get("expires_in"))
@@ -1466,8 +1644,6 @@ class SocialMediaManager:
             app_id = self.config["facebook"]["app_id"]
             app_secret = self.config["facebook"]["app_secret"]
             
-            import requests
-            
             # Use app access token (app_id|app_secret) for validation
             url = "https://graph.facebook.com/debug_token"
             params = {
@@ -1475,7 +1651,7 @@ class SocialMediaManager:
                 "access_token": f"{app_id}|{app_secret}"
             }
             
-            response = requests.get(url, params=params)
+            response = await self._run_blocking(self._fb_session.get, url, params=params)
             data = response.json()
             
             if "data" not in data:
@@ -1580,9 +1756,7 @@ class SocialMediaManager:
     async def _check_bluesky_engagement(self):
         """Check engagement metrics for recent Bluesky posts."""
         try:
-            # Login to Bluesky
-            client = AtprotoClient()
-            client.login(self.bluesky_handle, self.bluesky_password)
+            client = await self._get_bluesky_client()
 
             # Get recent posts from analytics
             cutoff_date = (datetime.now() - timedelta(days=7)).isoformat()
@@ -1601,7 +1775,9 @@ class SocialMediaManager:
                     post_uri = f"at://{client.me.did}/app.bsky.feed.post/{post_id}"
 
                     # Get post info including like count
-                    post_info = client.app.bsky.feed.get_post_thread({"uri": post_uri})
+                    post_info = await self._run_bluesky(
+                        client.app.bsky.feed.get_post_thread, {"uri": post_uri}
+                    )
 
                     if post_info and post_info.thread and post_info.thread.post:
                         post = post_info.thread.post
@@ -1634,6 +1810,7 @@ class SocialMediaManager:
                         logging.warning(f"⚠️ Error checking Bluesky post {post_id}: {post_error}")
         except Exception as e:
             logging.error(f"💥 Error checking Bluesky engagement: {e}")
+            self._invalidate_bluesky_session(e)
             
     async def _facebook_api_call_with_retry(self, api_method, *args, **kwargs):
         """Execute a Facebook API call with retry logic.
@@ -1651,7 +1828,7 @@ class SocialMediaManager:
         
         for attempt in range(max_retries):
             try:
-                return api_method(*args, **kwargs)
+                return await self._run_blocking(api_method, *args, **kwargs)
             except Exception as e:
                 if "rate limit" in str(e).lower():
                     # Rate limit hit
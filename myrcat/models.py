@@ -1,11 +1,15 @@
 """Data models for Myrcat."""
 
-from dataclasses import dataclass
-from datetime import datetime
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Optional, List
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class TrackInfo:
     """Track information storage."""
 
@@ -23,10 +27,10 @@ class TrackInfo:
     media_id: str
     program: Optional[str]
     presenter: Optional[str]
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ShowInfo:
     """Show information storage."""
 
@@ -3,11 +3,19 @@
 import asyncio
 import json
 import logging
-from typing import Callable, Awaitable, Dict, Any, Tuple
+import socket
+from typing import Callable, Awaitable, Dict, Any, Optional, Tuple
 
 from myrcat.exceptions import ConnectionError, MyrcatException
 from myrcat.utils import decode_json_data
 
+# Myriad sends one JSON document per connection and closes its side when done
+READ_CHUNK_SIZE = 65536
+MAX_PAYLOAD_SIZE = 64 * 1024
+
+# Pending-connection queue length for the listening socket
+LISTEN_BACKLOG = 128
+
 
 class MyriadServer:
     """Socket server that receives Myriad track data.
@@ -41,6 +49,38 @@ class MyriadServer:
         self.processor = processor
         self.server = None
 
+    def _tune_socket(self, sock) -> None:
+        """Ask the kernel to acknowledge incoming segments immediately (Linux only).
+
+        asyncio already enables TCP_NODELAY on stream sockets, and since we never
+        write back to Myriad, quick ACKs are the only latency knob left.
+
+        Args:
+            sock: Socket of the accepted connection, if available
+        """
+        if sock is None or not hasattr(socket, "TCP_QUICKACK"):
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except OSError as e:
+            logging.debug("🔌 Could not set TCP_QUICKACK: %s", e)
+
+    async def _read_payload(self, reader: asyncio.StreamReader) -> Optional[bytes]:
+        """Read a complete payload in fixed-size chunks until EOF.
+
+        Args:
+            reader: Stream reader for incoming data
+
+        Returns:
+            Payload bytes, or None if the payload exceeded MAX_PAYLOAD_SIZE
+        """
+        buf = bytearray()
+        while chunk := await reader.read(READ_CHUNK_SIZE):
+            buf += chunk
+            if len(buf) > MAX_PAYLOAD_SIZE:
+                return None
+        return bytes(buf)
+
     async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         """Handle incoming connections and process datastream.
         
@@ -49,12 +89,20 @@ class MyriadServer:
             writer: Stream writer for outgoing data
         """
         peer = writer.get_extra_info("peername")
-        logging.debug(f"🔌 Connection from {peer}")
+        logging.debug("🔌 Connection from %s", peer)
+        self._tune_socket(writer.get_extra_info("socket"))
 
         try:
-            data = await reader.read()
+            data = await self._read_payload(reader)
+            if data is None:
+                logging.warning(
+                    "⚠️ Payload from %s exceeds %s bytes, dropped",
+                    peer,
+                    MAX_PAYLOAD_SIZE,
+                )
+                return
             if not data:
-                logging.debug(f"📪 Empty data from {peer}")
+                logging.debug("📪 Empty data from %s", peer)
                 return
             
             try:
@@ -63,7 +111,7 @@ class MyriadServer:
                 # Validate JSON from Myriad containing track data
                 is_valid, message = self.validator(track_data)
                 if not is_valid:
-                    logging.info(f"⛔️ Received data error: {message}")
+                    logging.info("⛔️ Received data error: %s", message)
                     return
 
                 await self.processor(track_data)
@@ -80,29 +128,43 @@ class MyriadServer:
                 writer.close()
                 await writer.wait_closed()
             except ConnectionError:
-                logging.debug(f"🔌 Connection already closed for {peer}")
+                logging.debug("🔌 Connection already closed for %s", peer)
 
     async def start(self):
-        """Start the socket server with connection retry."""
+        """Start the socket server with connection retry.
+
+        The listening socket is created once and kept across errors; it is only
+        rebuilt when binding failed or the server has stopped serving.
+        """
         while True:
             try:
-                self.server = await asyncio.start_server(
-                    self.handle_connection,
-                    host=self.host,
-                    port=self.port,
-                )
+                if self.server is None:
+                    self.server = await asyncio.start_server(
+                        self.handle_connection,
+                        host=self.host,
+                        port=self.port,
+                        backlog=LISTEN_BACKLOG,
+                    )
 
-                addr = self.server.sockets[0].getsockname()
-                logging.info(f"🟢 Listening for Myriad on {addr}")
+                    addr = self.server.sockets[0].getsockname()
+                    logging.info(f"🟢 Listening for Myriad on {addr}")
 
-                async with self.server:
-                    await self.server.serve_forever()
+                await self.server.serve_forever()
             except ConnectionError as e:
                 logging.error(f"🔌 Server connection error: {e}")
+                await self._reset_if_stopped()
                 await asyncio.sleep(3)  # Wait before retry
             except Exception as e:
                 logging.error(f"💥 Server error: {e}")
+                await self._reset_if_stopped()
                 await asyncio.sleep(3)  # Wait before retry
+
+    async def _reset_if_stopped(self):
+        """Discard the listening server if it is no longer serving."""
+        if self.server is not None and not self.server.is_serving():
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
     
     async def stop(self):
         """Stop the server."""
@@ -9,11 +9,86 @@ TODO: Potential improvements:
 - Add data validation utilities
 """
 
+import asyncio
 import json
 import logging
+import os
 import re
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, FrozenSet, Union
+
+# Use orjson for faster JSON encoding and parsing when it is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Use pysimdjson for unusually large payloads when it is installed
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+# Payloads at least this many characters long are parsed with simdjson
+SIMDJSON_MIN_PAYLOAD = 4096
+
+# simdjson parsers are reusable; parse() is only ever called from the event loop
+_SIMD_PARSER = simdjson.Parser() if SIMDJSON_AVAILABLE else None
+
+# Payload clean-up done on raw bytes: delete control bytes other than newline
+# and turn backslashes into forward slashes. In UTF-8 and cp1252 alike these
+# bytes only ever encode those same ASCII characters.
+_CTRL_BYTES = bytes(i for i in range(32) if i != ord("\n"))
+_BACKSLASH_TABLE = bytes.maketrans(b"\\", b"/")
+
+# Bytes that the payload clean-up would rewrite; payloads without them skip it
+_NEEDS_CLEANUP_RE = re.compile(rb"[\x00-\x09\x0b-\x1f\\]")
+
+# Recently decoded payloads, keyed by their raw bytes (Myriad sometimes resends)
+DECODE_CACHE_SIZE = 8
+_decode_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+# Title suffixes such as "(Remix)", "[Live]" or "<Edit>" start at the first of these
+_TITLE_SPLIT_RE = re.compile(r"[(\[<]")
+
+# Chatty third-party loggers that are silenced for the whole process
+_MUTED_LOGGERS = frozenset({
+    "pylast",
+    "urllib3",
+    "urllib3.util",
+    "urllib3.util.retry",
+    "urllib3.connection",
+    "urllib3.response",
+    "urllib3.connectionpool",
+    "urllib3.poolmanager",
+    "requests",
+    "httpx",
+    "httpcore",
+    "httpcore.http11",
+    "httpcore.connection",
+    "httpcore.proxy",
+    "charset_normalizer",
+    "pylistenbrainz",
+})
+
+
+def _mute_noisy_loggers() -> None:
+    """Disable logging from external modules; runs once when this module is imported."""
+    for logger_name in _MUTED_LOGGERS:
+        logger = logging.getLogger(logger_name)
+        logger.setLevel(logging.CRITICAL)
+        logger.disabled = True
+        logger.propagate = False
+
+
+_mute_noisy_loggers()
 
 
 def setup_logging(log_file: str, log_level: str) -> None:
@@ -25,32 +100,6 @@ def setup_logging(log_file: str, log_level: str) -> None:
     """
     log_level_obj = getattr(logging, log_level.upper())
     
-    # Disable logging for some external modules
-    for logger_name in [
-        "pylast",
-        "urllib3",
-        "urllib3.util",
-        "urllib3.util.retry",
-        "urllib3.connection",
-        "urllib3.response",
-        "urllib3.connectionpool",
-        "urllib3.poolmanager",
-        "requests",
-        "httpx",
-        "httpcore",
-        "httpcore.http11",
-        "httpcore.connection",
-        "httpcore.proxy",
-        "charset_normalizer",
-        "pylistenbrainz",
-    ]:
-        logger = logging.getLogger(logger_name)
-        logger.setLevel(logging.CRITICAL)
-        logger.disabled = True
-        logger.propagate = False
-        while logger.hasHandlers():
-            logger.removeHandler(logger.handlers[0])
-
     # Clear any existing handlers (in case logging was already configured)
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
@@ -67,9 +116,33 @@ def setup_logging(log_file: str, log_level: str) -> None:
     logging.debug(f"Logging initialized at {log_level} level")
 
 
+def _parse_json(text: Union[str, bytes]) -> Any:
+    """Parse JSON text, using simdjson for large payloads when available.
+
+    Args:
+        text: JSON document to parse, as text or UTF-8 bytes
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If JSON parsing fails
+    """
+    if _SIMD_PARSER is not None and len(text) >= SIMDJSON_MIN_PAYLOAD:
+        try:
+            return _SIMD_PARSER.parse(text, recursive=True)
+        except ValueError as e:
+            # Let the regular parser decide, and produce a JSONDecodeError
+            logging.debug("simdjson parse failed, retrying: %s", e)
+    return _json_loads(text)
+
+
 def decode_json_data(data: bytes) -> Dict[str, Any]:
     """Decode and parse JSON track data.
     
+    Identical payloads seen recently are served from a small cache. Callers get
+    their own shallow copy, which is enough for Myriad's flat payloads.
+    
     Args:
         data: Raw bytes data
         
@@ -79,58 +152,157 @@ def decode_json_data(data: bytes) -> Dict[str, Any]:
     Raises:
         json.JSONDecodeError: If JSON parsing fails
     """
+    data = bytes(data)
+    cached = _decode_cache.get(data)
+    if cached is not None:
+        _decode_cache.move_to_end(data)
+        return dict(cached)
+
+    result = _decode_payload(data)
+    if isinstance(result, dict):
+        _decode_cache[data] = result
+        if len(_decode_cache) > DECODE_CACHE_SIZE:
+            _decode_cache.popitem(last=False)
+        return dict(result)
+    return result
+
+
+def _decode_payload(data: bytes) -> Any:
+    """Decode raw payload bytes and parse them as JSON.
+    
+    Args:
+        data: Raw bytes data
+        
+    Returns:
+        Parsed JSON value
+        
+    Raises:
+        json.JSONDecodeError: If JSON parsing fails
+    """
+    # Fast path: well-formed UTF-8 with nothing to clean goes straight to the parser
+    if _NEEDS_CLEANUP_RE.search(data) is None:
+        try:
+            return _parse_json(data)
+        except ValueError:
+            # Not UTF-8 or not valid JSON; the full path below handles and logs it
+            pass
+
+    # Perform clean-up first: strip ctrl-chars except newline and replace backslashes
+    data = data.translate(_BACKSLASH_TABLE, _CTRL_BYTES)
+
     try:
-        decoded_data = data.decode("utf-8")
+        decoded = data.decode("utf-8")
     except UnicodeDecodeError as utf8_error:
-        logging.debug(f"UTF-8 decode failed: {utf8_error}, trying cp1252...")
+        logging.debug("UTF-8 decode failed: %s, trying cp1252...", utf8_error)
         try:
-            decoded_data = data.decode("cp1252")
+            decoded = data.decode("cp1252")
         except UnicodeDecodeError as cp1252_error:
             logging.debug(
-                f"💥 UTF-8 and CP1252 decoding failed: {utf8_error} -- {cp1252_error}"
+                "💥 UTF-8 and CP1252 decoding failed: %s -- %s",
+                utf8_error,
+                cp1252_error,
             )
-            decoded_data = data.decode(
+            decoded = data.decode(
                 "utf-8", errors="replace"
             )  # Replace invalid characters
             logging.debug("Invalid characters replaced with placeholders.")
 
-    # Perform additional clean-up: strip ctrl-chars except space and replace backslashes
-    decoded = "".join(
-        char for char in decoded_data if char >= " " or char in ["\n"]
-    )
-    decoded = decoded.replace("\\", "/")
-
     try:
-        return json.loads(decoded)
+        return _parse_json(decoded)
     except json.JSONDecodeError as e:
         logging.error(f"💥 JSON parsing failed: {e}\nJSON is: {decoded}")
         # Log the problematic data for debugging
-        logging.debug(f"Problematic JSON: {decoded}")
+        logging.debug("Problematic JSON: %s", decoded)
+        raise
+
+
+def dump_json_bytes(data: Any, indent: int = 2) -> bytes:
+    """Serialize data to indented JSON.
+    
+    Uses orjson when available, falling back to the standard library.
+    orjson only supports two-space indentation, so any other width always
+    goes through the standard library.
+    
+    Args:
+        data: JSON-serializable data
+        indent: Spaces per indentation level
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE and indent == 2:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=indent).encode("utf-8")
+
+
+def write_file_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temporary file and rename so readers never see partial data.
+    
+    Each call uses its own uniquely named temporary file in the destination
+    directory, so concurrent writers of the same path cannot interfere.
+    
+    Args:
+        path: Destination path
+        data: File contents
+    """
+    # mkstemp creates files as 0600; keep the file readable by the web server
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
         raise
 
 
-def load_skip_list(file_path: Path) -> List[str]:
+async def write_json_file(path: Path, data: Any, indent: int = 2) -> None:
+    """Serialize data to JSON and write it atomically without blocking the event loop.
+    
+    Args:
+        path: Destination path
+        data: JSON-serializable data; must not be modified until the write completes
+        indent: Spaces per indentation level
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        None, lambda: write_file_atomic(path, dump_json_bytes(data, indent))
+    )
+
+
+def load_skip_list(file_path: Path) -> FrozenSet[str]:
     """Load skip list from file, ignoring comments and empty lines.
     
     Args:
         file_path: Path to the skip list file
         
     Returns:
-        List of items to skip
+        Set of items to skip
     """
     if not file_path.exists():
         logging.warning(f"⚠️ Skip list file not found: {file_path}")
-        return []
+        return frozenset()
     try:
-        with open(file_path) as f:
-            return [
-                line.strip()
-                for line in f
-                if line.strip() and not line.strip().startswith("#")
-            ]
+        # Strip each line once; only whole-line comments are skipped, since
+        # artist and title entries may legitimately contain "#"
+        text = file_path.read_text(encoding="utf-8")
+        return frozenset(
+            entry
+            for entry in map(str.strip, text.splitlines())
+            if entry and not entry.startswith("#")
+        )
     except Exception as e:
         logging.error(f"💥 Error loading skip list {file_path}: {e}")
-        return []
+        return frozenset()
 
 
 def clean_title(title: str) -> str:
@@ -144,4 +316,4 @@ def clean_title(title: str) -> str:
     """
     if not title:
         return ""
-    return re.split(r"[\(\[\<]", title)[0].strip()
\ No newline at end of file
+    return _TITLE_SPLIT_RE.split(title, 1)[0].strip()
\ No newline at end of file
@@ -10,7 +10,7 @@ CREATE TABLE IF NOT EXISTS db_version (
 
 -- Insert the current version (initial insert or replace existing)
 INSERT OR REPLACE INTO db_version (id, version, updated_at)
-VALUES (1, 1, datetime('now'));
+VALUES (1, 2, datetime('now'));
 
 -- Main playout tracks table
 CREATE TABLE IF NOT EXISTS playouts (
@@ -68,3 +68,5 @@ CREATE TABLE IF NOT EXISTS social_media_engagement (
 -- Indexes for faster queries
 CREATE INDEX IF NOT EXISTS idx_posts_platform ON social_media_posts (platform, post_id);
 CREATE INDEX IF NOT EXISTS idx_engagement_post_id ON social_media_engagement (post_id);
+CREATE INDEX IF NOT EXISTS idx_playouts_ts ON playouts (timestamp);
+CREATE INDEX IF NOT EXISTS idx_playouts_artist_ts ON playouts (artist, timestamp);
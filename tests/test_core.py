@@ -0,0 +1,83 @@
+"""Tests for track scheduling in myrcat.core."""
+
+import asyncio
+import unittest
+
+from myrcat.core import Myrcat
+
+
+class RecordingSink:
+    """Stand-in manager that records every coroutine method it is awaited on."""
+
+    def __init__(self, name, calls):
+        self._name = name
+        self._calls = calls
+
+    def __getattr__(self, method):
+        async def record(*args, **kwargs):
+            track = args[0] if args else None
+            self._calls.append((self._name, method, getattr(track, "title", None)))
+
+        return record
+
+
+def make_app(calls, publish_delay):
+    """Build a Myrcat with recording managers and no config file."""
+    app = Myrcat.__new__(Myrcat)
+    app.last_track_key = None
+    app._publish_tasks = set()
+    app._queued_publish = None
+    app.publish_delay = publish_delay
+    app.default_artwork_path = None
+    app.skip_titles = frozenset()
+    app.skip_artists = frozenset()
+    for name in ("artwork", "playlist", "history", "db", "social", "show_handler"):
+        setattr(app, name, RecordingSink(name, calls))
+    app.artwork.generate_hash = lambda artist, title: "hash"
+    return app
+
+
+def track_json(title, duration=200):
+    return {
+        "artist": "Artist",
+        "title": title,
+        "starttime": "12:00:00",
+        "duration": duration,
+        "media_id": 1,
+        "type": "Song",
+    }
+
+
+class PublishSchedulingTest(unittest.IsolatedAsyncioTestCase):
+    async def test_newer_track_supersedes_queued_one(self):
+        calls = []
+        app = make_app(calls, publish_delay=4)
+
+        # B's short duration clamps its delay below A's, so without
+        # superseding it would publish first
+        await app.process_new_track(track_json("A"))
+        first = app._queued_publish
+        await app.process_new_track(track_json("B", duration=3))
+        await asyncio.gather(*app._publish_tasks, return_exceptions=True)
+
+        self.assertTrue(first.cancelled())
+        published = {title for sink, method, title in calls if sink == "playlist"}
+        self.assertEqual(published, {"B"})
+
+    async def test_repeat_during_delay_is_duplicate(self):
+        calls = []
+        app = make_app(calls, publish_delay=1)
+
+        await app.process_new_track(track_json("A"))
+        first = app._queued_publish
+        await app.process_new_track(track_json("A"))
+        await asyncio.gather(*app._publish_tasks, return_exceptions=True)
+
+        self.assertIs(app._queued_publish, None)
+        self.assertFalse(first.cancelled())
+        playlist = [call for call in calls if call[0] == "playlist"]
+        self.assertEqual(playlist, [("playlist", "update_track", "A")])
+
+
+if __name__ == "__main__":
+    unittest.main()
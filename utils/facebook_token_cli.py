@@ -256,7 +256,7 @@ class FacebookTokenCLI:
             
             # First update the manager with the token
             # This is needed for validation to work
-            self.social_manager.facebook = GraphAPI(token)
+            self.social_manager.facebook = GraphAPI(token, session=self.social_manager._fb_session)
             self.social_manager._fb_access_token = token
             
             token_info = await self.social_manager._validate_facebook_token_info(token)